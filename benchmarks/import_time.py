@@ -0,0 +1,101 @@
+"""
+Σ-Mesh Import-Time Profile
+==========================
+Summarizes `python -X importtime` for the cold-start critical modules:
+- Total cumulative import time
+- Slowest direct dependencies
+- Deferred heavy modules (e.g. scipy) that leaked into module load
+
+Usage:
+    python -m benchmarks.import_time dashboard.server.main
+
+ΛΦ = 2.176435×10⁻⁸ s⁻¹
+"""
+
+import os
+import subprocess
+import sys
+from typing import Dict, List, Sequence
+
+from benchmarks.microbench import REPO_ROOT
+
+
+COLD_START_MODULES = ("dashboard.server.main", "metrics.lambda_phi_recorder")
+
+# Must only be imported lazily (warm_imports), never at module load
+DEFERRED_MODULES = ("scipy",)
+
+
+def _importtime(module: str) -> List[tuple]:
+    """Parse -X importtime output into (self_us, cumulative_us, depth, name)"""
+    env = {**os.environ, "PYTHONPATH": str(REPO_ROOT)}
+    env.pop("PYTHONIMPORTTIME", None)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((int(self_us), int(cumulative_us), depth, name.strip()))
+    return entries
+
+
+def profile_import(module: str, runs: int = 3, top: int = 5) -> Dict:
+    """Fastest of `runs` cold imports (the first run also pays .pyc compilation)"""
+    best = None
+    for _ in range(runs):
+        entries = _importtime(module)
+        index = next(
+            i for i, (_, _, depth, name) in enumerate(entries)
+            if name == module and depth == 0
+        )
+        if best is None or entries[index][1] < best[0]:
+            best = (entries[index][1], entries, index)
+
+    total, entries, index = best
+
+    # importtime lists children before their parent: the module's own
+    # subtree runs back to the previous top-level entry
+    start = index
+    while start > 0 and entries[start - 1][2] > 0:
+        start -= 1
+    subtree = entries[start:index + 1]
+
+    names = {name for _, _, _, name in subtree}
+    leaked = sorted(
+        name for name in names
+        if name in DEFERRED_MODULES
+    )
+    direct = sorted(
+        (entry for entry in subtree if entry[2] == 1),
+        key=lambda entry: entry[1],
+        reverse=True
+    )
+
+    return {
+        "total_ms": total / 1e3,
+        "modules_imported": len(names),
+        "slowest": {name: cumulative / 1e3 for _, cumulative, _, name in direct[:top]},
+        "deferred_imported": len(leaked),
+        "deferred_modules": leaked,
+    }
+
+
+def run_import_profile(modules: Sequence[str] = COLD_START_MODULES) -> Dict[str, Dict]:
+    return {module: profile_import(module) for module in modules}
+
+
+if __name__ == "__main__":
+    import json
+
+    modules = sys.argv[1:] or COLD_START_MODULES
+    print(json.dumps(run_import_profile(modules), indent=2))
@@ -0,0 +1,228 @@
+"""
+Σ-Mesh Dashboard Load Generator
+===============================
+Drives a dashboard server end to end:
+- Concurrent POST /api/metrics/record ingestion
+- N /ws/metrics clients measuring broadcast fan-out delivery
+
+Starts a local uvicorn instance unless a target URL is given.
+Requires httpx and websockets.
+
+ΛΦ = 2.176435×10⁻⁸ s⁻¹
+"""
+
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+
+from benchmarks.microbench import REPO_ROOT
+
+
+PAYLOAD = {
+    "counts": {"0": 487, "1": 537},
+    "drifts": [0.02, 0.03, 0.025, 0.028, 0.031],
+    "distA": [0.48, 0.52],
+    "distB": [0.5, 0.5],
+}
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def local_server(
+    workers: int = 1,
+    startup_timeout: float = 30.0,
+    stats: Optional[Dict] = None
+) -> Iterator[str]:
+    """
+    Run the dashboard under uvicorn on a free port; yields its base URL
+
+    Cold-start (spawn -> /api/health) and warm-up (spawn -> /api/ready)
+    times are written to `stats` when given.
+    """
+    import httpx
+
+    port = _free_port()
+    # Built up front: a fresh httpx client per probe costs ~70ms of TLS
+    # setup, which would be billed to the server's cold start
+    probe_client = httpx.Client(timeout=1.0)
+    spawned = time.perf_counter()
+    env = {**os.environ, "PYTHONPATH": str(REPO_ROOT)}
+    ring = None
+    if workers > 1:
+        from dashboard.server.shared_state import SharedMetricsRing
+
+        # Shared-memory metrics ring so every client sees every ingest
+        ring = SharedMetricsRing(f"sigma-metrics-bench-{port}", create=True)
+        env["SIGMA_DASHBOARD_SHM"] = ring.name
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "dashboard.server.main:app",
+            "--host", "127.0.0.1", "--port", str(port),
+            "--workers", str(workers), "--log-level", "warning",
+        ],
+        cwd=REPO_ROOT,
+        env=env
+    )
+    url = f"http://127.0.0.1:{port}"
+
+    try:
+        deadline = time.monotonic() + startup_timeout
+        with probe_client:
+            for probe, stat in (("health", "cold_start_s"), ("ready", "ready_s")):
+                while True:
+                    if process.poll() is not None:
+                        raise RuntimeError(f"uvicorn exited with code {process.returncode}")
+                    try:
+                        probe_client.get(f"{url}/api/{probe}").raise_for_status()
+                        break
+                    except httpx.HTTPError:
+                        if time.monotonic() > deadline:
+                            raise RuntimeError(f"Dashboard server did not pass /api/{probe}")
+                        time.sleep(0.005)
+                if stats is not None:
+                    stats[stat] = time.perf_counter() - spawned
+        yield url
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+        if ring is not None:
+            ring.close()
+
+
+def _percentiles_ms(samples: List[float]) -> Dict:
+    if not samples:
+        return {"p50_ms": None, "p99_ms": None}
+    values = np.asarray(samples) * 1e3
+    return {
+        "p50_ms": float(np.percentile(values, 50)),
+        "p99_ms": float(np.percentile(values, 99)),
+    }
+
+
+async def _ws_client(url: str, ready: asyncio.Event, stop: asyncio.Event, latencies: List[float]):
+    import websockets
+
+    async with websockets.connect(url.replace("http", "ws", 1) + "/ws/metrics") as ws:
+        ready.set()
+        while not stop.is_set():
+            try:
+                message = await asyncio.wait_for(ws.recv(), timeout=0.25)
+            except asyncio.TimeoutError:
+                continue
+            data = json.loads(message)
+            # Ingest broadcasts carry Λ; the periodic simulated frames do not
+            if "Λ" in data:
+                latencies.append(time.time() - data["timestamp"])
+
+
+async def _ingest_worker(client, url: str, deadline: float, latencies: List[float], errors: List[int]):
+    while time.monotonic() < deadline:
+        start = time.perf_counter()
+        try:
+            response = await client.post(f"{url}/api/metrics/record", json=PAYLOAD)
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - start)
+        except Exception:
+            errors.append(1)
+
+
+async def _drive(url: str, duration: float, concurrency: int, ws_clients: int) -> Dict:
+    import httpx
+
+    stop = asyncio.Event()
+    delivery: List[float] = []
+    readies = [asyncio.Event() for _ in range(ws_clients)]
+    clients = [
+        asyncio.create_task(_ws_client(url, ready, stop, delivery))
+        for ready in readies
+    ]
+    await asyncio.wait_for(asyncio.gather(*(r.wait() for r in readies)), timeout=30)
+
+    ingest: List[float] = []
+    errors: List[int] = []
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(limits=limits, timeout=10.0) as client:
+        # Warm the ingest path before timing, and wait until every client
+        # has received that broadcast so none of them lands in the timed phase
+        await client.post(f"{url}/api/metrics/record", json=PAYLOAD)
+        settle = time.monotonic() + 10.0
+        while len(delivery) < ws_clients and time.monotonic() < settle:
+            await asyncio.sleep(0.01)
+        delivery.clear()
+
+        start = time.monotonic()
+        deadline = start + duration
+        await asyncio.gather(*(
+            _ingest_worker(client, url, deadline, ingest, errors)
+            for _ in range(concurrency)
+        ))
+        elapsed = time.monotonic() - start
+
+    # Allow in-flight broadcasts to land
+    await asyncio.sleep(0.5)
+    stop.set()
+    await asyncio.gather(*clients, return_exceptions=True)
+
+    expected = len(ingest) * ws_clients
+    return {
+        "ingest": {
+            "requests": len(ingest),
+            "errors": len(errors),
+            "rps": len(ingest) / elapsed if elapsed else 0.0,
+            **_percentiles_ms(ingest),
+        },
+        "websocket": {
+            "clients": ws_clients,
+            "broadcasts_received": len(delivery),
+            "broadcasts_expected": expected,
+            "delivery_ratio": len(delivery) / expected if expected else 1.0,
+            **_percentiles_ms(delivery),
+        },
+    }
+
+
+def run_load(
+    url: Optional[str] = None,
+    duration: float = 10.0,
+    concurrency: int = 16,
+    ws_clients: int = 32,
+    workers: int = 1
+) -> Dict:
+    """
+    Run the load scenario against `url`, or a fresh local server
+
+    Returns:
+        Ingest throughput/latency and WebSocket delivery statistics
+    """
+    params = {
+        "duration_s": duration,
+        "concurrency": concurrency,
+        "ws_clients": ws_clients,
+        "workers": workers,
+    }
+    if url:
+        return {"params": params, **asyncio.run(_drive(url, duration, concurrency, ws_clients))}
+
+    startup: Dict = {}
+    with local_server(workers=workers, stats=startup) as local_url:
+        return {
+            "params": params,
+            "startup": startup,
+            **asyncio.run(_drive(local_url, duration, concurrency, ws_clients))
+        }
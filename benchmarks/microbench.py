@@ -0,0 +1,211 @@
+"""
+Σ-Mesh Microbenchmarks
+======================
+Per-call latency of the Python hot paths:
+- LambdaPhiRecorder metric computations
+- SigmaMeshGovernor routing and heartbeat ticks
+- Organism operator handlers (requires kopf)
+- Instrumentation overhead on those paths
+
+ΛΦ = 2.176435×10⁻⁸ s⁻¹
+"""
+
+import asyncio
+import importlib.util
+import logging
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def load_module(relative_path: str, name: str) -> ModuleType:
+    """Import a repo script by path (the governor/operator filenames are hyphenated)"""
+    spec = importlib.util.spec_from_file_location(name, REPO_ROOT / relative_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def summarize(samples_ns: List[int]) -> Dict:
+    """Latency summary in microseconds"""
+    samples = np.asarray(samples_ns, dtype=np.float64) / 1e3
+    return {
+        "iterations": len(samples),
+        "mean_us": float(samples.mean()),
+        "p50_us": float(np.percentile(samples, 50)),
+        "p99_us": float(np.percentile(samples, 99)),
+        "ops_per_sec": float(1e6 / samples.mean()) if samples.mean() else 0.0
+    }
+
+
+def bench(func: Callable, iterations: int, warmup: int = 100) -> Dict:
+    """Time a synchronous zero-argument callable"""
+    perf_counter_ns = time.perf_counter_ns
+    for _ in range(warmup):
+        func()
+
+    samples = []
+    for _ in range(iterations):
+        start = perf_counter_ns()
+        func()
+        samples.append(perf_counter_ns() - start)
+    return summarize(samples)
+
+
+def bench_async(factory: Callable, iterations: int, warmup: int = 100) -> Dict:
+    """Time a zero-argument coroutine factory inside one event loop"""
+    async def run() -> List[int]:
+        perf_counter_ns = time.perf_counter_ns
+        for _ in range(warmup):
+            await factory()
+
+        samples = []
+        for _ in range(iterations):
+            start = perf_counter_ns()
+            await factory()
+            samples.append(perf_counter_ns() - start)
+        return samples
+
+    return summarize(asyncio.run(run()))
+
+
+def recorder_benchmarks(iterations: int) -> Dict[str, Dict]:
+    from metrics.lambda_phi_recorder import LambdaPhiRecorder
+
+    recorder = LambdaPhiRecorder()
+    counts = {'0': 487, '1': 537}
+    drifts = [0.02, 0.03, 0.025, 0.028, 0.031]
+    reference = [0.5, 0.5]
+
+    results = {
+        "recorder.compute_lambda_phi": bench(
+            lambda: recorder.compute_lambda_phi(counts), iterations
+        ),
+        "recorder.compute_gamma": bench(
+            lambda: recorder.compute_gamma(drifts), iterations
+        ),
+        "recorder.compute_w2": bench(
+            lambda: recorder.compute_w2([0.48, 0.52], reference), iterations
+        ),
+        "recorder.record_metrics": bench(
+            lambda: recorder.record_metrics(counts, drifts, reference), iterations
+        ),
+    }
+    results["recorder.get_metrics_summary"] = bench(
+        recorder.get_metrics_summary, max(iterations // 100, 10), warmup=1
+    )
+    return results
+
+
+def governor_benchmarks(iterations: int, agents: int = 64) -> Dict[str, Dict]:
+    governor_module = load_module("mesh/sigma-mesh-governor.py", "sigma_mesh_governor")
+    Agent = governor_module.Agent
+    AgentStatus = governor_module.AgentStatus
+
+    async def build():
+        governor = governor_module.SigmaMeshGovernor()
+        now = asyncio.get_event_loop().time()
+        ids = [f"Agent{i}.v1" for i in range(agents)]
+        for i, agent_id in enumerate(ids):
+            await governor.register_agent(Agent(
+                id=agent_id,
+                kind="worker_organism",
+                status=AgentStatus.ACTIVE,
+                last_heartbeat=now,
+                coherence=0.8 + 0.1 * (i % 3) / 3,
+                pathways_in=[ids[i - 1]],
+                pathways_out=[ids[(i + 1) % agents]]
+            ))
+        return governor, ids
+
+    governor, ids = asyncio.run(build())
+
+    async def heartbeat_tick():
+        # One iteration of _sigma_heartbeat without the sleep
+        governor.running = True
+        governor.heartbeat_interval = 0
+        task = asyncio.ensure_future(governor._sigma_heartbeat())
+        await asyncio.sleep(0)
+        governor.running = False
+        await task
+
+    return {
+        "governor.route_task": bench_async(
+            lambda: governor.route_task(ids[0], ids[1], {"op": "compile"}), iterations
+        ),
+        "governor.update_sigma_field": bench_async(
+            governor._update_sigma_field, iterations
+        ),
+        "governor.heartbeat_tick": bench_async(
+            heartbeat_tick, max(iterations // 10, 10)
+        ),
+    }
+
+
+def operator_benchmarks(iterations: int) -> Optional[Dict[str, Dict]]:
+    """Operator handlers; None when kopf is not installed"""
+    try:
+        operator = load_module("k8s/operators/organism-operator.py", "organism_operator")
+    except ImportError:
+        return None
+
+    logging.getLogger("organism_operator").setLevel(logging.WARNING)
+    spec = {
+        "id": "QuantumAgent.v1",
+        "kind": "hardware_organism",
+        "traits": ["compile_openqasm_3_circuits"],
+        "pathways": {"input": ["PlannerAgent.v1"], "output": ["GovernorAgent.v1"]},
+        "quantum": {"backend": "ibm_osaka", "template": "loschmidt_echo"},
+    }
+
+    return {
+        "operator.create_organism": bench(
+            lambda: operator.create_organism(spec, "bench", "default"), iterations
+        ),
+        "operator.quantum_update": bench(
+            lambda: operator.quantum_update(spec, "bench"), iterations
+        ),
+        "operator.check_organism_health": bench(
+            lambda: operator.check_organism_health(spec, {"coherence": 0.8}, "bench"),
+            iterations
+        ),
+    }
+
+
+def instrumentation_overhead(results: Dict[str, Dict]) -> Dict:
+    """Inline-timer cost relative to the p50 of the paths that carry it"""
+    from metrics.instrumentation import timer_overhead
+
+    governor_module = load_module("mesh/sigma-mesh-governor.py", "sigma_mesh_governor")
+
+    timer_ns = timer_overhead() * 1e9
+    overhead: Dict = {"timer_ns": timer_ns}
+    # (benchmark, timed observations per call); route_task samples 1 in N
+    for name, timers in (
+        ("recorder.record_metrics", 2),
+        ("governor.route_task", 1 / governor_module.ROUTE_SAMPLE_EVERY)
+    ):
+        p50_us = results.get(name, {}).get("p50_us")
+        if p50_us:
+            overhead[name] = {"overhead_pct": 100.0 * timers * timer_ns / (p50_us * 1e3)}
+    return overhead
+
+
+def run_microbenchmarks(iterations: int = 5000) -> Dict[str, Dict]:
+    """Run every microbenchmark group"""
+    results = {}
+    results.update(recorder_benchmarks(iterations))
+    results.update(governor_benchmarks(iterations))
+
+    operator_results = operator_benchmarks(iterations)
+    if operator_results is None:
+        results["operator"] = {"skipped": "kopf not installed"}
+    else:
+        results.update(operator_results)
+    return results
@@ -0,0 +1,283 @@
+"""
+Σ-Mesh Workload Replay
+======================
+Re-drives captured traffic (metrics/workload_capture.py) as a
+repeatable benchmark:
+- ingest events -> POST /api/metrics/record on a dashboard server
+- route events  -> SigmaMeshGovernor.route_task on a local governor
+
+Speed: 1 replays in real time, N compresses inter-arrival gaps N×,
+"max" dispatches as fast as the concurrency limit allows.
+
+Usage:
+    python -m benchmarks.replay convert traffic.jsonl workload.sigcap
+    python -m benchmarks.replay info workload.sigcap
+    python -m benchmarks.replay run workload.sigcap --speed 10 --output replay.json
+
+ΛΦ = 2.176435×10⁻⁸ s⁻¹
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from benchmarks.load_generator import local_server
+from benchmarks.microbench import load_module
+from metrics.workload_capture import INGEST, KIND_NAMES, ROUTE, WorkloadCapture, read_capture
+
+
+Event = Tuple[float, int, Dict]
+
+
+def convert_jsonl(source: str, destination: str, interval: float = 0.01) -> Dict:
+    """
+    Turn a JSON-lines traffic dump into a capture log (overwriting it)
+
+    Lines with `counts` become ingest events and lines with
+    `source`/`target` become route events; anything else is skipped.
+    An optional `timestamp` field is kept; lines without one are placed
+    `interval` seconds after the previous event, so they stay on the same
+    clock as the explicit timestamps (events before the first explicit
+    timestamp are spaced back from it; with none at all the clock starts at 0).
+    """
+    stats = Counter()
+    parsed: List[Tuple[Optional[float], int, Dict]] = []
+
+    with open(source) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            timestamp = record.pop("timestamp", None)
+
+            if "counts" in record:
+                parsed.append((timestamp, INGEST, record))
+                stats["ingest"] += 1
+            elif "source" in record and "target" in record:
+                record.setdefault("task", {})
+                parsed.append((timestamp, ROUTE, record))
+                stats["route"] += 1
+            else:
+                stats["skipped"] += 1
+
+    explicit = [i for i, (timestamp, _, _) in enumerate(parsed) if timestamp is not None]
+    clock = parsed[explicit[0]][0] - (explicit[0] + 1) * interval if explicit else -interval
+
+    events: List[Event] = []
+    for timestamp, kind, record in parsed:
+        clock = timestamp if timestamp is not None else clock + interval
+        events.append((clock, kind, record))
+
+    # Offline conversion: unbounded queue, so nothing is dropped; the
+    # destination is rewritten so re-running convert never duplicates events
+    capture = WorkloadCapture(destination, max_pending=0, truncate=True)
+    for timestamp, kind, payload in events:
+        capture.record(kind, payload, timestamp)
+    capture.close()
+
+    return dict(stats)
+
+
+def load_events(path: str) -> List[Event]:
+    """Capture events in timestamp order (multi-worker and converted logs may interleave)"""
+    return sorted(read_capture(path), key=lambda event: event[0])
+
+
+def describe(events: List[Event]) -> Dict:
+    """Event counts, span and mean rate of time-ordered capture events"""
+    if not events:
+        return {"events": 0}
+    span = events[-1][0] - events[0][0]
+    return {
+        "events": len(events),
+        "by_kind": dict(Counter(KIND_NAMES.get(kind, str(kind)) for _, kind, _ in events)),
+        "span_s": span,
+        "mean_rate_per_s": len(events) / span if span > 0 else None,
+    }
+
+
+def _build_governor(events: List[Event]):
+    """Local governor with every captured route's agents and pathways"""
+    module = load_module("mesh/sigma-mesh-governor.py", "sigma_mesh_governor")
+    governor = module.SigmaMeshGovernor()
+    governor.capture = None  # Never re-capture replayed traffic
+
+    pathways: Dict[str, Tuple[set, set]] = {}
+    for _, kind, payload in events:
+        if kind == ROUTE:
+            pathways.setdefault(payload["source"], (set(), set()))[1].add(payload["target"])
+            pathways.setdefault(payload["target"], (set(), set()))[0].add(payload["source"])
+
+    async def register():
+        now = asyncio.get_running_loop().time()
+        for agent_id, (inbound, outbound) in pathways.items():
+            await governor.register_agent(module.Agent(
+                id=agent_id,
+                kind="replay_organism",
+                status=module.AgentStatus.ACTIVE,
+                last_heartbeat=now,
+                coherence=0.85,
+                pathways_in=sorted(inbound),
+                pathways_out=sorted(outbound)
+            ))
+
+    return governor, register
+
+
+def _summary_ms(samples: List[float]) -> Dict:
+    if not samples:
+        return {"p50_ms": None, "p99_ms": None}
+    values = np.asarray(samples) * 1e3
+    return {
+        "p50_ms": float(np.percentile(values, 50)),
+        "p99_ms": float(np.percentile(values, 99)),
+    }
+
+
+async def _replay(
+    events: List[Event],
+    url: Optional[str],
+    speed: float,
+    concurrency: int
+) -> Dict:
+    import httpx
+
+    governor, register = _build_governor(events)
+    await register()
+
+    latencies: Dict[int, List[float]] = {INGEST: [], ROUTE: []}
+    errors = Counter()
+    lag: List[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with httpx.AsyncClient(timeout=30.0) as client:
+        async def dispatch(kind: int, payload: Dict):
+            start = time.perf_counter()
+            try:
+                if kind == INGEST:
+                    response = await client.post(f"{url}/api/metrics/record", json=payload)
+                    response.raise_for_status()
+                else:
+                    await governor.route_task(payload["source"], payload["target"], dict(payload["task"]))
+                latencies[kind].append(time.perf_counter() - start)
+            except Exception:
+                errors[KIND_NAMES[kind]] += 1
+            finally:
+                semaphore.release()
+
+        loop = asyncio.get_running_loop()
+        tasks = []
+        t0 = events[0][0]
+        started = loop.time()
+
+        for timestamp, kind, payload in events:
+            if kind == INGEST and url is None:
+                continue
+            if speed:
+                due = started + (timestamp - t0) / speed
+                delay = due - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                lag.append(max(loop.time() - due, 0.0))
+
+            await semaphore.acquire()
+            tasks.append(asyncio.create_task(dispatch(kind, payload)))
+
+        await asyncio.gather(*tasks)
+        elapsed = loop.time() - started
+
+    dispatched = sum(len(v) for v in latencies.values()) + sum(errors.values())
+    return {
+        "events": dispatched,
+        "errors": dict(errors),
+        "elapsed_s": elapsed,
+        "events_per_s": dispatched / elapsed if elapsed else None,
+        "dispatch_lag": _summary_ms(lag),
+        "ingest": {"count": len(latencies[INGEST]), **_summary_ms(latencies[INGEST])},
+        "route": {"count": len(latencies[ROUTE]), **_summary_ms(latencies[ROUTE])},
+    }
+
+
+def replay(
+    path: str,
+    url: Optional[str] = None,
+    speed: float = 1.0,
+    concurrency: int = 16,
+    workers: int = 1
+) -> Dict:
+    """
+    Replay a capture log
+
+    Args:
+        path: Capture log
+        url: Dashboard to drive (a local one is started if ingest events exist)
+        speed: Time compression factor; 0 for maximum speed
+        concurrency: Maximum in-flight events (1 preserves strict ordering)
+        workers: Worker count for the local dashboard
+
+    Returns:
+        Replay statistics
+    """
+    events = load_events(path)
+    result = {"capture": describe(events), "speed": speed or "max", "concurrency": concurrency}
+    if not events:
+        return result
+
+    if url or not any(kind == INGEST for _, kind, _ in events):
+        return {**result, **asyncio.run(_replay(events, url, speed, concurrency))}
+
+    with local_server(workers=workers) as local_url:
+        return {**result, **asyncio.run(_replay(events, local_url, speed, concurrency))}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Σ-mesh workload replay")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    convert = commands.add_parser("convert", help="JSON lines -> capture log")
+    convert.add_argument("source")
+    convert.add_argument("destination")
+    convert.add_argument("--interval", type=float, default=0.01)
+
+    info = commands.add_parser("info", help="Summarize a capture log")
+    info.add_argument("capture")
+
+    run = commands.add_parser("run", help="Replay a capture log")
+    run.add_argument("capture")
+    run.add_argument("--url", help="Target an existing dashboard server")
+    run.add_argument("--speed", default="1", help='Time compression factor or "max"')
+    run.add_argument("--concurrency", type=int, default=16)
+    run.add_argument("--workers", type=int, default=1)
+    run.add_argument("--output", help="Write results JSON here (default: stdout)")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "convert":
+        result = convert_jsonl(args.source, args.destination, args.interval)
+    elif args.command == "info":
+        result = describe(load_events(args.capture))
+    else:
+        # Replayed traffic must not be captured again by local components
+        os.environ.pop("SIGMA_CAPTURE_PATH", None)
+        speed = 0.0 if args.speed == "max" else float(args.speed)
+        result = replay(args.capture, args.url, speed, args.concurrency, args.workers)
+
+    report = json.dumps(result, indent=2)
+    if getattr(args, "output", None):
+        with open(args.output, "w") as f:
+            f.write(report)
+    else:
+        print(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
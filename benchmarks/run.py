@@ -0,0 +1,145 @@
+"""
+Σ-Mesh Benchmark Runner
+=======================
+Runs the microbenchmarks and (optionally) the dashboard load scenario,
+writes machine-readable JSON and fails on regressions:
+- Absolute limits from benchmarks/thresholds.json (including cold-start
+  import time, deferred-import leaks and instrumentation overhead)
+- Relative p50 slowdowns against a previous results file (--baseline)
+- Limits with no result are listed under `unchecked_thresholds`
+
+Usage:
+    python -m benchmarks.run --output bench.json
+    python -m benchmarks.run --load --ws-clients 64 --baseline main.json
+
+ΛΦ = 2.176435×10⁻⁸ s⁻¹
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from benchmarks.import_time import run_import_profile
+from benchmarks.microbench import instrumentation_overhead, run_microbenchmarks
+
+
+THRESHOLDS_PATH = Path(__file__).parent / "thresholds.json"
+
+
+def check_thresholds(
+    results: Dict,
+    thresholds: Dict,
+    path: str = "",
+    unchecked: Optional[List[str]] = None
+) -> List[str]:
+    """
+    Walk the threshold tree; leaves are {"max": x} / {"min": x}
+
+    Limits with no result (skipped benchmark, scenario not run, renamed
+    metric) are appended to `unchecked` so they never pass silently.
+    """
+    failures = []
+    for key, limit in thresholds.items():
+        name = f"{path}.{key}" if path else key
+        value: Any = results.get(key) if isinstance(results, dict) else None
+
+        if isinstance(limit, dict) and ("max" in limit or "min" in limit):
+            if value is None:
+                if unchecked is not None:
+                    unchecked.append(name)
+                continue
+            if "max" in limit and value > limit["max"]:
+                failures.append(f"{name} = {value:.4g} exceeds max {limit['max']}")
+            if "min" in limit and value < limit["min"]:
+                failures.append(f"{name} = {value:.4g} below min {limit['min']}")
+        elif isinstance(limit, dict):
+            failures.extend(check_thresholds(value if isinstance(value, dict) else {}, limit, name, unchecked))
+    return failures
+
+
+def check_baseline(results: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """Flag microbenchmarks whose p50 grew by more than `tolerance`"""
+    failures = []
+    previous = baseline.get("microbenchmarks", {})
+    for name, current in results.get("microbenchmarks", {}).items():
+        before = previous.get(name, {}).get("p50_us")
+        now = current.get("p50_us")
+        if before and now and now > before * (1.0 + tolerance):
+            failures.append(
+                f"microbenchmarks.{name}.p50_us = {now:.4g} "
+                f"regressed {now / before - 1.0:+.1%} vs baseline {before:.4g}"
+            )
+    return failures
+
+
+def run(args: argparse.Namespace) -> Dict:
+    results: Dict[str, Any] = {
+        "timestamp": time.time(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "microbenchmarks": run_microbenchmarks(iterations=args.iterations),
+    }
+    results["instrumentation"] = instrumentation_overhead(results["microbenchmarks"])
+
+    if not args.skip_import_time:
+        results["import_time"] = run_import_profile()
+
+    if args.load:
+        from benchmarks.load_generator import run_load
+
+        results["load"] = run_load(
+            url=args.url,
+            duration=args.duration,
+            concurrency=args.concurrency,
+            ws_clients=args.ws_clients,
+            workers=args.workers
+        )
+
+    thresholds = json.loads(Path(args.thresholds).read_text())
+    unchecked: List[str] = []
+    failures = check_thresholds(results, thresholds, unchecked=unchecked)
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        failures.extend(check_baseline(results, baseline, args.tolerance))
+
+    results["regressions"] = failures
+    results["unchecked_thresholds"] = unchecked
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Σ-mesh benchmark suite")
+    parser.add_argument("--iterations", type=int, default=5000)
+    parser.add_argument("--skip-import-time", action="store_true", help="Skip the -X importtime profile")
+    parser.add_argument("--load", action="store_true", help="Run the dashboard load scenario")
+    parser.add_argument("--url", help="Target an existing server instead of a local one")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--ws-clients", type=int, default=32)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--thresholds", default=str(THRESHOLDS_PATH))
+    parser.add_argument("--baseline", help="Previous results JSON for relative checks")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--output", help="Write results JSON here (default: stdout)")
+    args = parser.parse_args(argv)
+
+    results = run(args)
+    report = json.dumps(results, indent=2)
+    if args.output:
+        Path(args.output).write_text(report)
+    else:
+        print(report)
+
+    for failure in results["regressions"]:
+        print(f"[Σ] REGRESSION: {failure}", file=sys.stderr)
+    if results["unchecked_thresholds"]:
+        print(f"[Σ] UNCHECKED: {', '.join(results['unchecked_thresholds'])}", file=sys.stderr)
+    return 1 if results["regressions"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
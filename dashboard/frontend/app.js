@@ -9,6 +9,8 @@ const LAMBDA_PHI = 2.176435e-8;
 const API_BASE = window.location.origin;
 const WS_URL = `ws://${window.location.host}/ws/metrics`;
 
+const MAX_HISTORY = 100;
+
 let ws = null;
 let metricsHistory = [];
 
@@ -26,8 +28,8 @@ function initWebSocket() {
         updateDashboard(metrics);
         metricsHistory.push(metrics);
 
-        // Keep only last 100 entries
-        if (metricsHistory.length > 100) {
+        // Keep only last MAX_HISTORY entries
+        if (metricsHistory.length > MAX_HISTORY) {
             metricsHistory.shift();
         }
     };
@@ -141,6 +143,17 @@ function updateLambdaPhiChart() {
         .text('Φ');
 }
 
+// Seed ΛΦ chart with server-downsampled (LTTB) history
+async function loadLambdaPhiTimeline() {
+    const response = await fetch(
+        `${API_BASE}/api/metrics/lambda-phi?max_points=${MAX_HISTORY}&series=phi`
+    );
+    const data = await response.json();
+
+    metricsHistory = data.timeline.slice(-MAX_HISTORY);
+    updateLambdaPhiChart();
+}
+
 // Render Γ Tensor Heatmap
 async function renderGammaTensor() {
     const response = await fetch(`${API_BASE}/api/metrics/gamma-tensor`);
@@ -260,6 +273,7 @@ async function init() {
     // Render static visualizations
     await renderGammaTensor();
     await renderAgentNetwork();
+    await loadLambdaPhiTimeline();
 
     // Connect WebSocket for live updates
     initWebSocket();
@@ -6,18 +6,107 @@ FastAPI server providing real-time Σ-mesh metrics
 ΛΦ = 2.176435×10⁻⁸ s⁻¹
 """
 
-from fastapi import FastAPI, WebSocket
-from fastapi.responses import HTMLResponse, StreamingResponse
+from fastapi import FastAPI, Query, WebSocket
+from fastapi.responses import HTMLResponse, JSONResponse, PlainTextResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 import asyncio
 import json
-from typing import Dict, List
+import os
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional
 import time
 from pathlib import Path
 
+from metrics.downsampling import MultiResolutionSeries, lttb_indices
+from metrics.instrumentation import ENABLED as INSTRUMENTATION_ENABLED, REGISTRY, instrumented
+from metrics.workload_capture import INGEST, close_capture, get_capture
 
-app = FastAPI(title="Σ-Mesh Visualizer")
+
+class LatencyMiddleware:
+    """Per-endpoint HTTP latency, keyed by route template"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            route = scope.get("route")
+            REGISTRY.histogram(
+                "sigma_http_request_seconds",
+                "Dashboard HTTP request latency",
+                {"method": scope["method"], "path": getattr(route, "path", "unmatched")}
+            ).observe(time.perf_counter() - start)
+
+
+# Deferred heavy imports (numpy/scipy via the recorder), warmed at startup
+warmup_state = {"complete": False, "seconds": None}
+
+
+def warm_imports():
+    """Import the metrics recorder and its deferred dependencies"""
+    start = time.perf_counter()
+    from metrics.lambda_phi_recorder import warm_imports as warm_recorder
+
+    warm_recorder()
+    warmup_state["seconds"] = time.perf_counter() - start
+    warmup_state["complete"] = True
+
+
+# Multi-worker mode: ingests go through a shared-memory ring and every
+# worker's hub fans them out to its own WebSocket clients
+SHARED_STATE_NAME = os.environ.get("SIGMA_DASHBOARD_SHM")
+RING_CAPACITY = int(os.environ.get("SIGMA_DASHBOARD_RING_CAPACITY", "65536"))
+metrics_hub = None
+
+# Opt-in ingest capture for replay (SIGMA_CAPTURE_PATH)
+workload_capture = None
+
+
+async def deliver_metrics(batch: List[Dict]):
+    """Store and broadcast metrics delivered by the shared hub"""
+    for metrics in batch:
+        store_metrics(metrics)
+        await broadcast_metrics(metrics)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global metrics_hub, workload_capture
+
+    # Warm in the background so the server accepts connections immediately;
+    # /api/ready reports 503 until the first ingest will not pay import cost
+    warmup = asyncio.get_running_loop().run_in_executor(None, warm_imports)
+
+    if SHARED_STATE_NAME:
+        from dashboard.server.shared_state import MetricsHub, SharedMetricsRing
+
+        ring = SharedMetricsRing.attach_or_create(SHARED_STATE_NAME, RING_CAPACITY)
+        metrics_hub = MetricsHub(ring, deliver_metrics, on_history=store_metrics)
+        metrics_hub.start()
+
+    workload_capture = get_capture()
+
+    try:
+        yield
+    finally:
+        if workload_capture is not None:
+            close_capture()
+            workload_capture = None
+        if metrics_hub is not None:
+            metrics_hub.close()
+            metrics_hub.ring.close()
+            metrics_hub = None
+        await warmup
+
+
+app = FastAPI(title="Σ-Mesh Visualizer", lifespan=lifespan)
 
 # Add CORS middleware
 app.add_middleware(
@@ -28,6 +117,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if INSTRUMENTATION_ENABLED:
+    app.add_middleware(LatencyMiddleware)
+
 # Constants
 LAMBDA_PHI = 2.176435e-8
 
@@ -35,6 +127,28 @@ LAMBDA_PHI = 2.176435e-8
 metrics_store: List[Dict] = []
 active_websockets: List[WebSocket] = []
 
+# 1 s / 1 min / 1 h tiers of ingested metrics for /api/metrics/lambda-phi
+TIMELINE_FIELDS = {"Λ": "lambda", "Φ": "phi", "Γ": "gamma", "W₂": "w2"}
+timeline = MultiResolutionSeries(fields=tuple(TIMELINE_FIELDS.values()))
+
+
+def store_metrics(metrics: Dict):
+    """Keep an ingested record and fold it into the timeline tiers"""
+    metrics_store.append(metrics)
+    timeline.add(
+        metrics["timestamp"],
+        {name: metrics[key] for key, name in TIMELINE_FIELDS.items()}
+    )
+
+WEBSOCKET_CLIENTS = REGISTRY.gauge(
+    "sigma_websocket_clients",
+    "Connected /ws/metrics clients"
+)
+INGESTED_METRICS = REGISTRY.counter(
+    "sigma_metrics_ingested_total",
+    "Metrics recorded via /api/metrics/record"
+)
+
 
 @app.get("/")
 async def root():
@@ -55,6 +169,29 @@ async def health():
     }
 
 
+@app.get("/api/ready")
+async def ready():
+    """Readiness probe: healthy once deferred imports are warm"""
+    if not warmup_state["complete"]:
+        return JSONResponse(
+            status_code=503,
+            content={"status": "warming"}
+        )
+    return {
+        "status": "ready",
+        "warmup_seconds": warmup_state["seconds"]
+    }
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics():
+    """Prometheus text exposition of hot-path instrumentation"""
+    return PlainTextResponse(
+        REGISTRY.render(),
+        media_type="text/plain; version=0.0.4"
+    )
+
+
 @app.get("/api/mesh/status")
 async def mesh_status():
     """Get current Σ-mesh status"""
@@ -110,23 +247,52 @@ async def mesh_status():
 
 
 @app.get("/api/metrics/lambda-phi")
-async def lambda_phi_timeline():
-    """Get ΛΦ coherence timeline"""
+async def lambda_phi_timeline(
+    max_points: int = Query(60, ge=2, le=10000),
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+    series: str = Query("phi", pattern="^(lambda|phi|gamma|w2)$")
+):
+    """
+    Get ΛΦ coherence timeline
+
+    Served from the 1 s / 1 min / 1 h tiers of ingested metrics, reduced
+    to at most `max_points` with LTTB (preserving the shape of `series`).
+    Falls back to a simulated hour only when nothing has been ingested; a
+    range with no ingested data returns an empty timeline.
+    """
+    if len(timeline):
+        points, resolution = timeline.query(start, end, max_points, series)
+        return {
+            "lambda_phi_constant": LAMBDA_PHI,
+            "resolution_seconds": resolution,
+            "timeline": points
+        }
+
     # Simulate ΛΦ timeline data
-    timeline = []
+    timeline_points = []
     base_time = time.time() - 3600  # Last hour
 
     for i in range(60):
-        timeline.append({
+        timeline_points.append({
             "timestamp": base_time + (i * 60),
             "lambda": LAMBDA_PHI + (0.01 * (i % 10) / 10),
             "phi": 0.85 + (0.1 * (i % 7) / 7),
             "gamma": 0.03 + (0.02 * (i % 5) / 5)
         })
 
+    if max_points < len(timeline_points):
+        selected = lttb_indices(
+            [p["timestamp"] for p in timeline_points],
+            [p.get(series, 0.0) for p in timeline_points],
+            max_points
+        )
+        timeline_points = [timeline_points[i] for i in selected]
+
     return {
         "lambda_phi_constant": LAMBDA_PHI,
-        "timeline": timeline
+        "resolution_seconds": 60,
+        "timeline": timeline_points
     }
 
 
@@ -181,17 +347,21 @@ async def record_metrics(payload: Dict):
         "distB": [...]
     }
     """
-    from metrics.lambda_phi_recorder import LambdaPhiRecorder
+    if workload_capture is not None:
+        workload_capture.record(INGEST, payload)
+
+    from metrics.lambda_phi_recorder import COMPUTE_W2_SECONDS, LambdaPhiRecorder
 
     recorder = LambdaPhiRecorder()
 
     # Compute metrics
     lambda_val, phi = recorder.compute_lambda_phi(payload["counts"])
     gamma = recorder.compute_gamma(payload.get("drifts", []))
-    w2 = recorder.compute_w2(
-        payload.get("distA", []),
-        payload.get("distB", [])
-    ) if "distA" in payload and "distB" in payload else 0.0
+    w2 = 0.0
+    if "distA" in payload and "distB" in payload:
+        w2_start = time.perf_counter()
+        w2 = recorder.compute_w2(payload["distA"], payload["distB"])
+        COMPUTE_W2_SECONDS.observe(time.perf_counter() - w2_start)
 
     metrics = {
         "Λ": lambda_val,
@@ -201,8 +371,15 @@ async def record_metrics(payload: Dict):
         "timestamp": time.time()
     }
 
+    INGESTED_METRICS.inc()
+
+    if metrics_hub is not None:
+        # Every worker (including this one) stores and broadcasts it
+        metrics_hub.publish(metrics)
+        return metrics
+
     # Store metrics
-    metrics_store.append(metrics)
+    store_metrics(metrics)
 
     # Broadcast to WebSocket clients
     await broadcast_metrics(metrics)
@@ -215,6 +392,7 @@ async def websocket_metrics(websocket: WebSocket):
     """WebSocket endpoint for real-time metrics streaming"""
     await websocket.accept()
     active_websockets.append(websocket)
+    WEBSOCKET_CLIENTS.set(len(active_websockets))
 
     try:
         while True:
@@ -237,8 +415,10 @@ async def websocket_metrics(websocket: WebSocket):
         print(f"WebSocket error: {e}")
     finally:
         active_websockets.remove(websocket)
+        WEBSOCKET_CLIENTS.set(len(active_websockets))
 
 
+@instrumented("sigma_broadcast_metrics_seconds", "WebSocket broadcast fan-out time")
 async def broadcast_metrics(metrics: Dict):
     """Broadcast metrics to all connected WebSocket clients"""
     for ws in active_websockets:
@@ -250,4 +430,22 @@ async def broadcast_metrics(metrics: Dict):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+
+    workers = int(os.environ.get("SIGMA_DASHBOARD_WORKERS", "1"))
+    if workers <= 1:
+        uvicorn.run(app, host="0.0.0.0", port=8000)
+    else:
+        from dashboard.server.shared_state import SharedMetricsRing
+
+        # The launcher owns the ring; workers attach via the environment
+        ring = SharedMetricsRing(f"sigma-metrics-{os.getpid()}", RING_CAPACITY, create=True)
+        os.environ["SIGMA_DASHBOARD_SHM"] = ring.name
+        try:
+            uvicorn.run(
+                "dashboard.server.main:app",
+                host="0.0.0.0",
+                port=8000,
+                workers=workers
+            )
+        finally:
+            ring.close()
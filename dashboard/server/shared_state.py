@@ -0,0 +1,272 @@
+"""
+Σ-Mesh Dashboard Shared State
+=============================
+Cross-worker metrics state for multi-worker deployments:
+- SharedMetricsRing: fixed-size ring of ingested metrics in
+  multiprocessing.shared_memory, appended under a file lock
+- MetricsHub: local pub/sub over UNIX datagram sockets that wakes every
+  worker to drain new ring entries into its WebSocket clients
+
+ΛΦ = 2.176435×10⁻⁸ s⁻¹
+"""
+
+import asyncio
+import fcntl
+import os
+import socket
+import stat
+import struct
+import tempfile
+from contextlib import contextmanager
+from multiprocessing import resource_tracker, shared_memory
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+
+# Header: magic, version, capacity, last written sequence number
+_HEADER = struct.Struct("<IIQQ")
+_MAGIC = 0x5349474D  # "SIGM"
+_VERSION = 1
+
+# Record: sequence number, Λ, Φ, Γ, W₂, timestamp
+_RECORD = struct.Struct("<Qddddd")
+RECORD_FIELDS = ("Λ", "Φ", "Γ", "W₂", "timestamp")
+
+
+@contextmanager
+def _untracked():
+    """
+    Attach without registering with the resource tracker
+
+    SharedMemory(track=False) only exists from Python 3.13. Registering an
+    attached segment would hand its lifetime to this process's tracker
+    (which unlinks it on exit), and unregistering afterwards would remove
+    the creator's entry from a tracker shared with the launcher.
+    """
+    register = resource_tracker.register
+
+    def skip_shared_memory(name, rtype):
+        if rtype != "shared_memory":
+            register(name, rtype)
+
+    resource_tracker.register = skip_shared_memory
+    try:
+        yield
+    finally:
+        resource_tracker.register = register
+
+
+class SharedMetricsRing:
+    """
+    Metrics ring buffer in POSIX shared memory
+
+    Sequence numbers start at 1. Each slot stores its own sequence number
+    so readers can detect entries overwritten while they lagged.
+
+    Only the creating process tracks the segment: `close()` on a ring made
+    with create=True unlinks it, and if that process dies first its
+    resource tracker unlinks it instead. Attached rings never unlink.
+    """
+
+    def __init__(self, name: str, capacity: int = 65536, create: bool = False):
+        size = _HEADER.size + capacity * _RECORD.size
+        self.name = name
+        self.owner = create
+
+        if create:
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+            _HEADER.pack_into(self._shm.buf, 0, _MAGIC, _VERSION, capacity, 0)
+        else:
+            with _untracked():
+                self._shm = shared_memory.SharedMemory(name=name)
+
+        magic, version, self.capacity, _ = _HEADER.unpack_from(self._shm.buf, 0)
+        if magic != _MAGIC or version != _VERSION:
+            self._shm.close()
+            raise ValueError(f"Shared memory {name} is not a Σ-mesh metrics ring")
+
+        # Appends lock the segment's own descriptor, so no lock file is
+        # left behind; each SharedMemory has its own open file description
+        self._lock_fd = self._shm._fd
+
+    @classmethod
+    def attach_or_create(cls, name: str, capacity: int = 65536) -> "SharedMetricsRing":
+        """
+        Attach to an existing ring, creating it if this is the first worker
+
+        Workers restart independently, so a creating worker does not unlink
+        on close; the segment stays registered with the tracker its
+        multiprocessing-spawned workers share, which unlinks it once the
+        whole worker group has exited.
+        """
+        try:
+            return cls(name, capacity)
+        except FileNotFoundError:
+            pass
+        try:
+            ring = cls(name, capacity, create=True)
+        except FileExistsError:
+            return cls(name, capacity)
+        ring.owner = False
+        return ring
+
+    @property
+    def last_seq(self) -> int:
+        return _HEADER.unpack_from(self._shm.buf, 0)[3]
+
+    def append(self, metrics: Dict) -> int:
+        """Append one metrics record; returns its sequence number"""
+        values = tuple(float(metrics[field]) for field in RECORD_FIELDS)
+
+        fcntl.flock(self._lock_fd, fcntl.LOCK_EX)
+        try:
+            seq = self.last_seq + 1
+            offset = _HEADER.size + ((seq - 1) % self.capacity) * _RECORD.size
+            _RECORD.pack_into(self._shm.buf, offset, seq, *values)
+            struct.pack_into("<Q", self._shm.buf, _HEADER.size - 8, seq)
+        finally:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+        return seq
+
+    def read_since(self, after_seq: int) -> Tuple[List[Dict], int]:
+        """
+        Records with sequence numbers > after_seq still held in the ring
+
+        Returns:
+            (records, last sequence number read)
+        """
+        last = self.last_seq
+        first = max(after_seq + 1, last - self.capacity + 1, 1)
+        records = []
+        for seq in range(first, last + 1):
+            offset = _HEADER.size + ((seq - 1) % self.capacity) * _RECORD.size
+            slot_seq, *values = _RECORD.unpack_from(self._shm.buf, offset)
+            if slot_seq == seq:
+                records.append(dict(zip(RECORD_FIELDS, values)))
+        return records, last
+
+    def close(self):
+        self._shm.close()
+        if self.owner:
+            self._shm.unlink()
+
+
+class MetricsHub:
+    """
+    Per-worker subscriber: wakes on publish and drains the shared ring
+
+    Every worker binds a datagram socket in a private (0700, same-owner)
+    directory; publishing sends a one-byte wake-up to all of them
+    (including the publisher). The peer list is re-read only when the
+    directory changes or a send fails.
+    On start, records already in the ring are replayed into `on_history`
+    (not broadcast), so a late or restarted worker serves the same history
+    as its peers.
+    """
+
+    def __init__(
+        self,
+        ring: SharedMetricsRing,
+        on_metrics: Callable[[List[Dict]], Awaitable[None]],
+        on_history: Optional[Callable[[Dict], None]] = None
+    ):
+        self.ring = ring
+        self.on_metrics = on_metrics
+        self.on_history = on_history
+        self.hub_dir = Path(tempfile.gettempdir()) / f"{ring.name}.hub"
+        self.hub_dir.mkdir(mode=0o700, exist_ok=True)
+        info = os.lstat(self.hub_dir)
+        if (
+            not stat.S_ISDIR(info.st_mode)
+            or info.st_uid != os.getuid()
+            or stat.S_IMODE(info.st_mode) & 0o077
+        ):
+            raise PermissionError(
+                f"{self.hub_dir} must be a directory owned by this user with mode 0700"
+            )
+        self.path = self.hub_dir / f"{os.getpid()}.sock"
+
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._sock.setblocking(False)
+        self.path.unlink(missing_ok=True)
+        self._sock.bind(str(self.path))
+
+        self._peers: List[str] = []
+        self._peers_mtime: Optional[int] = None
+        self._last_seq = 0
+        self._draining = False
+        self._pending = False
+        self._loop = None
+
+    def start(self):
+        # The socket is already bound, so wake-ups for anything published
+        # after this read queue up and are drained from _last_seq on
+        records, self._last_seq = self.ring.read_since(0)
+        if self.on_history is not None:
+            for record in records:
+                self.on_history(record)
+
+        self._loop = asyncio.get_running_loop()
+        self._loop.add_reader(self._sock.fileno(), self._on_wake)
+
+    def _refresh_peers(self, force: bool = False):
+        """Re-list peer sockets if the hub directory changed"""
+        mtime = os.stat(self.hub_dir).st_mtime_ns
+        if force or mtime != self._peers_mtime:
+            self._peers = [str(peer) for peer in self.hub_dir.glob("*.sock")]
+            self._peers_mtime = mtime
+
+    def publish(self, metrics: Dict) -> int:
+        """Append to the shared ring and wake every worker"""
+        seq = self.ring.append(metrics)
+        self._refresh_peers()
+        stale = False
+        for peer in self._peers:
+            try:
+                self._sock.sendto(b"\x01", peer)
+            except (ConnectionRefusedError, FileNotFoundError):
+                # Worker exited without cleaning up
+                Path(peer).unlink(missing_ok=True)
+                stale = True
+            except BlockingIOError:
+                # Peer's queue is full: it already has a wake-up pending
+                pass
+        if stale:
+            self._refresh_peers(force=True)
+        return seq
+
+    def _on_wake(self):
+        try:
+            while True:
+                self._sock.recv(64)
+        except BlockingIOError:
+            pass
+
+        if self._draining:
+            self._pending = True
+        else:
+            # Claimed before the task runs so drains never overlap
+            self._draining = True
+            self._loop.create_task(self._drain())
+
+    async def _drain(self):
+        try:
+            while True:
+                self._pending = False
+                records, self._last_seq = self.ring.read_since(self._last_seq)
+                if records:
+                    await self.on_metrics(records)
+                if not self._pending:
+                    break
+        finally:
+            self._draining = False
+
+    def close(self):
+        if self._loop is not None:
+            self._loop.remove_reader(self._sock.fileno())
+        self._sock.close()
+        self.path.unlink(missing_ok=True)
+        try:
+            self.hub_dir.rmdir()  # Last worker out removes the directory
+        except OSError:
+            pass
@@ -10,14 +10,23 @@ Uses Kopf (Kubernetes Operator Framework)
 import kopf
 import yaml
 import asyncio
+import sys
+from pathlib import Path
 from typing import Dict, Any
 import logging
 
+# Repository root, for the shared metrics/ modules
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from metrics.circuit_cache import compile_cached, get_default_cache
+
 logger = logging.getLogger(__name__)
 
 
 LAMBDA_PHI = 2.176435e-8  # Universal Memory Constant
 
+QASM_DIR = Path(__file__).resolve().parents[2] / "qasm"
+
 
 @kopf.on.create('organisms.dnalang.dev')
 def create_organism(spec: Dict[str, Any], name: str, namespace: str, **_):
@@ -99,14 +108,44 @@ def quantum_update(spec: Dict[str, Any], name: str, **_):
     backend = quantum_config.get('backend', 'ibm_osaka')
 
     logger.info(f"[Σ] Target backend: {backend}")
+
+    # Circuit source: inline QASM or a qasm/ template name
+    source = quantum_config.get('circuit')
+    template = quantum_config.get('template')
+    if source is None and template is not None:
+        template_path = QASM_DIR / f"{template}.qasm"
+        if not template_path.exists():
+            raise kopf.PermanentError(f"Unknown circuit template: {template}")
+        source = template_path.read_text()
+
+    if source is None:
+        return {'quantum_status': 'configured'}
+
     logger.info(f"[Σ] Recompiling organism circuits for {backend}")
 
+    # Identical circuits/backends/options are served from the circuit cache
+    cache = get_default_cache()
+    options = quantum_config.get('compilation', {})
+    try:
+        compiled = compile_cached(source, backend=backend, options=options, cache=cache)
+    except ValueError as e:
+        raise kopf.PermanentError(f"Circuit compilation failed: {e}")
+
+    stats = cache.get_stats()
+    logger.info(
+        f"[Σ] Compiled {compiled.num_qubits} qubits, {len(compiled.ops)} ops "
+        f"(cache hit rate {stats['hit_rate']:.2%}, "
+        f"{stats['seconds_saved']:.3f}s saved)"
+    )
+
     # TODO: Integrate with IBM Quantum
-    # from qiskit import QuantumCircuit
-    # circuit = build_organism_circuit(spec)
-    # result = execute_on_backend(circuit, backend)
+    # result = execute_on_backend(compiled, backend)
 
-    return {'quantum_status': 'configured'}
+    return {
+        'quantum_status': 'configured',
+        'num_qubits': compiled.num_qubits,
+        'num_ops': len(compiled.ops),
+    }
 
 
 @kopf.timer('organisms.dnalang.dev', interval=10.0)
@@ -0,0 +1,348 @@
+"""
+Content-Addressed Circuit Cache
+===============================
+Two-tier cache for compiled circuits and deterministic results:
+- Keys: SHA-256 of normalized QASM + backend + compilation options
+- Memory tier: size-bounded LRU of live objects
+- Disk tier: size-bounded LRU of pickled artifacts (optional)
+- Stats: per-tier hits, misses, evictions and compile time saved, also
+  exported as sigma_circuit_cache_* metrics on the shared REGISTRY
+
+Result histograms are only cached for deterministic runs (fixed seed).
+
+ΛΦ = 2.176435×10⁻⁸ s⁻¹
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Tuple
+
+from metrics.instrumentation import REGISTRY
+from metrics.local_simulator import CompiledCircuit, LocalSimulator, compile_circuit, normalize_qasm
+
+
+LAMBDA_PHI = 2.176435e-8
+
+LOCAL_BACKEND = "local_simulator"
+
+# QuantumAgent.v1 compilation contract (organisms/QuantumAgent.v1.yaml)
+QUANTUM_AGENT_COMPILATION = {
+    "optimization_level": 3,
+    "routing_method": "sabre",
+    "layout_method": "dense",
+    "translation_method": "translator",
+    "scheduling_method": "asap",
+    "approximation_degree": 1.0,
+}
+
+COMPILED = "compiled"
+RESULT = "result"
+
+
+class CircuitCache:
+    """
+    Content-addressed LRU cache with a memory tier and an optional disk tier
+
+    Every value is stored with the wall time it took to produce, so hits
+    report how much compilation/simulation time they saved.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        memory_bytes: int = 64 * 1024 * 1024,
+        disk_bytes: int = 512 * 1024 * 1024
+    ):
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.memory_bytes = memory_bytes
+        self.disk_bytes = disk_bytes
+
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, Tuple[Any, int, float]]" = OrderedDict()
+        self._memory_size = 0
+        self._disk: "OrderedDict[str, int]" = OrderedDict()
+        self._disk_size = 0
+
+        self.stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "memory_evictions": 0,
+            "disk_evictions": 0,
+            "seconds_saved": 0.0,
+        }
+        self._counters = {
+            "memory_hits": REGISTRY.counter(
+                "sigma_circuit_cache_hits_total", "Circuit cache hits", {"tier": "memory"}
+            ),
+            "disk_hits": REGISTRY.counter(
+                "sigma_circuit_cache_hits_total", "Circuit cache hits", {"tier": "disk"}
+            ),
+            "misses": REGISTRY.counter(
+                "sigma_circuit_cache_misses_total", "Circuit cache misses"
+            ),
+            "memory_evictions": REGISTRY.counter(
+                "sigma_circuit_cache_evictions_total", "Circuit cache evictions", {"tier": "memory"}
+            ),
+            "disk_evictions": REGISTRY.counter(
+                "sigma_circuit_cache_evictions_total", "Circuit cache evictions", {"tier": "disk"}
+            ),
+            "seconds_saved": REGISTRY.counter(
+                "sigma_circuit_cache_seconds_saved_total",
+                "Compilation/simulation time avoided by cache hits"
+            ),
+        }
+        self._memory_gauge = REGISTRY.gauge(
+            "sigma_circuit_cache_bytes", "Circuit cache size", {"tier": "memory"}
+        )
+        self._disk_gauge = REGISTRY.gauge(
+            "sigma_circuit_cache_bytes", "Circuit cache size", {"tier": "disk"}
+        )
+
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._load_disk_index()
+
+    @staticmethod
+    def make_key(
+        kind: str,
+        qasm: str,
+        backend: str,
+        options: Optional[Mapping[str, Any]] = None
+    ) -> str:
+        """Content address for (kind, normalized QASM, backend, options)"""
+        digest = hashlib.sha256()
+        for part in (
+            kind,
+            normalize_qasm(qasm),
+            backend,
+            json.dumps(options or {}, sort_keys=True, default=str)
+        ):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.pkl"
+
+    def _load_disk_index(self):
+        """Rebuild the disk LRU order from file modification times"""
+        entries = []
+        for path in self.cache_dir.glob("*/*.pkl"):
+            stat = path.stat()
+            entries.append((stat.st_mtime, path.stem, stat.st_size))
+        for _, key, size in sorted(entries):
+            self._disk[key] = size
+            self._disk_size += size
+        self._evict_disk()
+
+    def _count(self, stat: str, amount: float = 1):
+        self.stats[stat] += amount
+        self._counters[stat].inc(amount)
+
+    def _evict_memory(self):
+        while self._memory_size > self.memory_bytes and self._memory:
+            _, (_, size, _) = self._memory.popitem(last=False)
+            self._memory_size -= size
+            self._count("memory_evictions")
+        self._memory_gauge.set(self._memory_size)
+
+    def _evict_disk(self):
+        while self._disk_size > self.disk_bytes and self._disk:
+            key, size = self._disk.popitem(last=False)
+            self._disk_size -= size
+            self._count("disk_evictions")
+            try:
+                self._path(key).unlink()
+            except FileNotFoundError:
+                pass
+        self._disk_gauge.set(self._disk_size)
+
+    def _remember(self, key: str, value: Any, size: int, cost: float):
+        if key in self._memory:
+            self._memory_size -= self._memory.pop(key)[1]
+        self._memory[key] = (value, size, cost)
+        self._memory_size += size
+        self._evict_memory()
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Look up a key; returns (hit, value)"""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self._count("memory_hits")
+                self._count("seconds_saved", entry[2])
+                return True, entry[0]
+
+            if key in self._disk:
+                path = self._path(key)
+                try:
+                    payload = path.read_bytes()
+                    os.utime(path)
+                except FileNotFoundError:
+                    self._disk_size -= self._disk.pop(key)
+                    self._disk_gauge.set(self._disk_size)
+                else:
+                    value, cost = pickle.loads(payload)
+                    self._disk.move_to_end(key)
+                    self._remember(key, value, len(payload), cost)
+                    self._count("disk_hits")
+                    self._count("seconds_saved", cost)
+                    return True, value
+
+            self._count("misses")
+            return False, None
+
+    def put(self, key: str, value: Any, cost: float = 0.0):
+        """Store a value in both tiers (write-through)"""
+        payload = pickle.dumps((value, cost), protocol=pickle.HIGHEST_PROTOCOL)
+
+        with self._lock:
+            self._remember(key, value, len(payload), cost)
+
+            if not self.cache_dir or len(payload) > self.disk_bytes:
+                return
+
+            path = self._path(key)
+            path.parent.mkdir(exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp, path)
+
+            if key in self._disk:
+                self._disk_size -= self._disk.pop(key)
+            self._disk[key] = len(payload)
+            self._disk_size += len(payload)
+            self._evict_disk()
+
+    def get_or_create(self, key: str, factory: Callable[[], Any]) -> Any:
+        """Return the cached value or build, time and store it"""
+        hit, value = self.get(key)
+        if hit:
+            return value
+
+        start = time.perf_counter()
+        value = factory()
+        self.put(key, value, cost=time.perf_counter() - start)
+        return value
+
+    def get_stats(self) -> Dict:
+        """Hit rates, tier sizes and time saved"""
+        with self._lock:
+            hits = self.stats["memory_hits"] + self.stats["disk_hits"]
+            lookups = hits + self.stats["misses"]
+            return {
+                **self.stats,
+                "hit_rate": hits / lookups if lookups else 0.0,
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_size,
+                "disk_entries": len(self._disk),
+                "disk_bytes": self._disk_size,
+            }
+
+
+_default_cache: Optional[CircuitCache] = None
+
+
+def get_default_cache() -> CircuitCache:
+    """
+    Process-wide cache configured from the environment
+
+    SIGMA_CIRCUIT_CACHE_DIR enables the disk tier; SIGMA_CIRCUIT_CACHE_MEMORY_MB
+    and SIGMA_CIRCUIT_CACHE_DISK_MB bound the tiers.
+    """
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = CircuitCache(
+            cache_dir=os.environ.get("SIGMA_CIRCUIT_CACHE_DIR") or None,
+            memory_bytes=int(os.environ.get("SIGMA_CIRCUIT_CACHE_MEMORY_MB", "64")) * 1024 * 1024,
+            disk_bytes=int(os.environ.get("SIGMA_CIRCUIT_CACHE_DISK_MB", "512")) * 1024 * 1024
+        )
+    return _default_cache
+
+
+def compile_cached(
+    qasm: str,
+    backend: str = LOCAL_BACKEND,
+    options: Optional[Mapping[str, Any]] = None,
+    free_parameters: Iterable[str] = (),
+    cache: Optional[CircuitCache] = None
+) -> CompiledCircuit:
+    """
+    Compile a circuit through the cache
+
+    Args:
+        qasm: OpenQASM 3 source
+        backend: Target backend name (part of the cache key)
+        options: Compilation options (defaults to the QuantumAgent.v1 contract)
+        free_parameters: Constants left unbound for sweeps
+        cache: Cache to use (process default if None)
+
+    Returns:
+        CompiledCircuit
+    """
+    cache = cache or get_default_cache()
+    free_parameters = tuple(free_parameters)
+    options = {
+        **QUANTUM_AGENT_COMPILATION,
+        **(options or {}),
+        "free_parameters": sorted(free_parameters)
+    }
+    key = cache.make_key(COMPILED, qasm, backend, options)
+    return cache.get_or_create(
+        key,
+        lambda: compile_circuit(qasm, free_parameters=free_parameters)
+    )
+
+
+def run_counts_cached(
+    qasm: str,
+    shots: int,
+    seed: Optional[int],
+    bindings: Optional[Mapping[str, float]] = None,
+    cache: Optional[CircuitCache] = None
+) -> Dict[str, int]:
+    """
+    Sample local simulator counts, caching histograms for seeded runs
+
+    Unseeded runs are not deterministic and always execute. Callers get
+    their own copy of the histogram, never the cached object.
+    """
+    cache = cache or get_default_cache()
+    bindings = dict(bindings or {})
+    circuit = compile_cached(qasm, free_parameters=bindings, cache=cache)
+
+    def run() -> Dict[str, int]:
+        return LocalSimulator(circuit).counts(shots, bindings=bindings, seed=seed)
+
+    if seed is None:
+        return run()
+
+    key = cache.make_key(
+        RESULT, qasm, LOCAL_BACKEND,
+        {"shots": shots, "seed": seed, "bindings": bindings}
+    )
+    return dict(cache.get_or_create(key, run))
+
+
+# Example usage
+if __name__ == "__main__":
+    qasm = (Path(__file__).parent.parent / "qasm" / "ghz_state.qasm").read_text()
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = CircuitCache(cache_dir=cache_dir)
+        for _ in range(100):
+            compile_cached(qasm, backend="ibm_osaka", cache=cache)
+            run_counts_cached(qasm, shots=1024, seed=7, cache=cache)
+
+        print("Circuit Cache Stats:")
+        print(json.dumps(cache.get_stats(), indent=2))
@@ -0,0 +1,227 @@
+"""
+ΛΦ Timeline Downsampling
+========================
+Server-side reduction of metric timelines for charting:
+- Largest-Triangle-Three-Buckets (LTTB) point selection
+- Incrementally maintained 1 s / 1 min / 1 h mean tiers, so any zoom
+  level is served from the finest tier that fits the point budget
+
+ΛΦ = 2.176435×10⁻⁸ s⁻¹
+"""
+
+import bisect
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+# (bucket width in seconds, buckets retained)
+DEFAULT_TIERS: Tuple[Tuple[int, int], ...] = (
+    (1, 86400),     # 1 s for a day
+    (60, 10080),    # 1 min for a week
+    (3600, 8760),   # 1 h for a year
+)
+
+# A tier is used when its bucket count over the range is within this
+# multiple of the requested points (LTTB then reduces the rest)
+OVERSAMPLE = 4
+
+
+def lttb_indices(x: Sequence[float], y: Sequence[float], threshold: int) -> List[int]:
+    """
+    Largest-Triangle-Three-Buckets point selection
+
+    Args:
+        x: Monotonic x values (timestamps)
+        y: Series values
+        threshold: Number of points to keep
+
+    Returns:
+        Indices of the selected points (always keeps first and last)
+    """
+    n = len(x)
+    if threshold >= n:
+        return list(range(n))
+    if threshold < 3:
+        return [0, n - 1][:max(threshold, 0)]
+
+    selected = [0]
+    bucket_size = (n - 2) / (threshold - 2)
+    a = 0
+
+    for i in range(threshold - 2):
+        # Average of the next bucket is the third triangle vertex
+        next_start = int((i + 1) * bucket_size) + 1
+        next_end = min(int((i + 2) * bucket_size) + 1, n)
+        span = next_end - next_start
+        avg_x = sum(x[next_start:next_end]) / span
+        avg_y = sum(y[next_start:next_end]) / span
+
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+        ax, ay = x[a], y[a]
+
+        best, best_area = start, -1.0
+        for j in range(start, end):
+            area = abs((ax - avg_x) * (y[j] - ay) - (ax - x[j]) * (avg_y - ay))
+            if area > best_area:
+                best, best_area = j, area
+
+        selected.append(best)
+        a = best
+
+    selected.append(n - 1)
+    return selected
+
+
+class _Tier:
+    """Running per-bucket sums for one resolution"""
+
+    def __init__(self, width: int, retention: int, fields: Sequence[str]):
+        self.width = width
+        self.retention = retention
+        self.starts: List[float] = []
+        self.counts: List[int] = []
+        self.sums: Dict[str, List[float]] = {field: [] for field in fields}
+        # First bucket start still complete after trimming (None: nothing trimmed)
+        self.low_water: Optional[float] = None
+
+    def add(self, timestamp: float, values: Dict[str, float]):
+        start = timestamp - (timestamp % self.width)
+
+        if self.starts and self.starts[-1] == start:
+            index = len(self.starts) - 1
+        elif not self.starts or start > self.starts[-1]:
+            index = len(self.starts)
+            self._insert(index, start)
+        else:
+            # Late sample: locate (or create) its bucket
+            index = bisect.bisect_left(self.starts, start)
+            if index == len(self.starts) or self.starts[index] != start:
+                self._insert(index, start)
+
+        self.counts[index] += 1
+        for field, series in self.sums.items():
+            series[index] += values.get(field, 0.0)
+
+        # Trim in slack-sized chunks to keep appends amortized O(1)
+        excess = len(self.starts) - self.retention
+        if excess > self.retention // 10:
+            del self.starts[:excess]
+            del self.counts[:excess]
+            for series in self.sums.values():
+                del series[:excess]
+            self.low_water = self.starts[0]
+
+    def _insert(self, index: int, start: float):
+        self.starts.insert(index, start)
+        self.counts.insert(index, 0)
+        for series in self.sums.values():
+            series.insert(index, 0.0)
+
+    def covers(self, start: Optional[float]) -> bool:
+        """Whether this tier still holds all of its data from `start` on"""
+        return self.low_water is None or (start is not None and start >= self.low_water)
+
+    def span(self, start: Optional[float], end: Optional[float]) -> Tuple[int, int]:
+        """Bucket index range overlapping [start, end]"""
+        lo = 0 if start is None else bisect.bisect_left(self.starts, start - (start % self.width))
+        hi = len(self.starts) if end is None else bisect.bisect_right(self.starts, end)
+        return lo, hi
+
+
+class MultiResolutionSeries:
+    """
+    Multi-field timeline with incrementally maintained mean tiers
+
+    Each sample updates one bucket per tier (O(1) amortized); queries
+    bisect the chosen tier and touch only the buckets they return.
+    """
+
+    def __init__(
+        self,
+        fields: Sequence[str],
+        tiers: Sequence[Tuple[int, int]] = DEFAULT_TIERS
+    ):
+        self.fields = tuple(fields)
+        self.tiers = [_Tier(width, retention, self.fields) for width, retention in tiers]
+
+    def __len__(self) -> int:
+        return len(self.tiers[0].starts)
+
+    def add(self, timestamp: float, values: Dict[str, float]):
+        """Fold one sample into every tier"""
+        for tier in self.tiers:
+            tier.add(timestamp, values)
+
+    def query(
+        self,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        max_points: int = 500,
+        series: Optional[str] = None
+    ) -> Tuple[List[Dict], Optional[int]]:
+        """
+        Points covering [start, end], at most `max_points`
+
+        Args:
+            start: Range start (default: earliest retained data)
+            end: Range end (default: latest data)
+            max_points: Upper bound on returned points
+            series: Field LTTB preserves the shape of (default: first field)
+
+        Returns:
+            (points, resolution in seconds) — points carry `timestamp`
+            (bucket start) and the mean of every field
+        """
+        # Finest tier that still holds the whole range and resolves it within
+        # the point budget. Tiers trimmed past `start` are skipped so that
+        # older data comes from a coarser tier; if every tier is trimmed,
+        # the coarsest one with data in range is used
+        chosen = None
+        for tier in self.tiers:
+            lo, hi = tier.span(start, end)
+            if hi > lo:
+                covered = tier.covers(start)
+                if covered or chosen is None or not chosen[3]:
+                    chosen = (tier, lo, hi, covered)
+                if covered and hi - lo <= max_points * OVERSAMPLE:
+                    break
+        if chosen is None:
+            return [], None
+
+        # If even the coarsest tier is denser than the budget, LTTB scans it;
+        # its retention bounds that cost
+        tier, lo, hi, _ = chosen
+        timestamps = tier.starts[lo:hi]
+        counts = tier.counts[lo:hi]
+        means = {
+            field: [s / c for s, c in zip(tier.sums[field][lo:hi], counts)]
+            for field in self.fields
+        }
+
+        indices = range(len(timestamps))
+        if len(timestamps) > max_points:
+            indices = lttb_indices(timestamps, means[series or self.fields[0]], max_points)
+
+        points = [
+            {"timestamp": timestamps[i], **{field: means[field][i] for field in self.fields}}
+            for i in indices
+        ]
+        return points, tier.width
+
+
+# Example usage
+if __name__ == "__main__":
+    import math
+    import time
+
+    timeline = MultiResolutionSeries(fields=("lambda", "phi"))
+    now = time.time()
+    for i in range(3 * 86400):
+        t = now - 3 * 86400 + i
+        timeline.add(t, {"lambda": abs(math.sin(i / 5000)), "phi": 0.85 + 0.1 * math.cos(i / 900)})
+
+    for label, span in (("5 min", 300), ("6 h", 6 * 3600), ("3 days", 3 * 86400)):
+        start = time.perf_counter()
+        points, resolution = timeline.query(now - span, now, max_points=200, series="phi")
+        elapsed = (time.perf_counter() - start) * 1e3
+        print(f"{label:>7}: {len(points)} points @ {resolution}s tier in {elapsed:.2f} ms")
@@ -0,0 +1,394 @@
+"""
+Σ-Mesh Hot-Path Instrumentation
+===============================
+Low-overhead Prometheus-style metrics:
+- Counters and gauges
+- HDR-style log-linear latency histograms (≤6.25% relative error),
+  exposed as Prometheus histograms so workers and pods aggregate
+- Lock-free recording: per-thread counter shards, GIL-atomic histogram
+  appends
+- Batched, vectorised bucketing off the per-call path
+- Text exposition for a /metrics endpoint
+
+Set SIGMA_INSTRUMENTATION=0 to compile the decorators out entirely and
+turn inline timers into no-ops.
+
+ΛΦ = 2.176435×10⁻⁸ s⁻¹
+"""
+
+import functools
+import inspect
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np  # Imported lazily at runtime to keep server cold start fast
+
+
+ENABLED = os.environ.get("SIGMA_INSTRUMENTATION", "1") != "0"
+
+# Histogram layout: values in microseconds, 32 exact buckets below 32µs,
+# then 16 linear sub-buckets per power of two up to ~2^40µs (~12 days)
+SUB_BUCKETS = 16
+LINEAR_BUCKETS = 2 * SUB_BUCKETS
+MAX_SHIFT = 36
+NUM_BUCKETS = LINEAR_BUCKETS + MAX_SHIFT * SUB_BUCKETS
+
+QUANTILES = (0.5, 0.9, 0.99, 0.999)
+
+# Exposed `le` bounds: the 1, 2, 4 … 32µs edges, then every 4th HDR bucket
+# edge (4 per power of two) up to ~134s. Being fixed bucket edges, the
+# cumulative counts are exact and identical across processes, so they sum
+# across workers and pods; slower samples only land in +Inf.
+EXPOSED_SUB_BUCKETS = (3, 7, 11, 15)
+EXPOSED_MAX_SHIFT = 22
+
+# Pending samples per thread before a vectorised bucketing pass
+FLUSH_SIZE = 1024
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _bucket_indices(seconds: "np.ndarray") -> "np.ndarray":
+    """Vectorised log-linear bucket index of each sample"""
+    import numpy as np
+
+    micros = np.maximum((seconds * 1e6).astype(np.int64), 0)
+    _, bit_length = np.frexp(micros.astype(np.float64))
+    shift = np.maximum(bit_length.astype(np.int64) - 5, 1)
+    indices = LINEAR_BUCKETS + (shift - 1) * SUB_BUCKETS + (micros >> shift) - SUB_BUCKETS
+    indices = np.where(micros < LINEAR_BUCKETS, micros, indices)
+    return np.minimum(indices, NUM_BUCKETS - 1)
+
+
+def _bucket_upper(index: int) -> int:
+    """Exclusive upper bound (µs) of a bucket"""
+    if index < LINEAR_BUCKETS:
+        return index + 1
+    shift, sub = divmod(index - LINEAR_BUCKETS, SUB_BUCKETS)
+    return (sub + SUB_BUCKETS + 1) << (shift + 1)
+
+
+def _exposed_buckets() -> List[Tuple[int, str]]:
+    """(bucket index, `le` label) pairs of the exposed histogram bounds"""
+    indices = [(1 << bit) - 1 for bit in range(6)]
+    indices += [
+        LINEAR_BUCKETS + shift * SUB_BUCKETS + sub
+        for shift in range(EXPOSED_MAX_SHIFT)
+        for sub in EXPOSED_SUB_BUCKETS
+    ]
+    return [(index, repr(_bucket_upper(index) / 1e6)) for index in indices]
+
+
+_EXPOSED_BUCKETS = _exposed_buckets()
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Labels, extra: Labels = ()) -> str:
+    pairs = labels + extra
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in pairs) + "}"
+
+
+class _Sharded:
+    """Per-thread value shards; each thread only ever writes its own"""
+
+    def __init__(self, size: int):
+        self._size = size
+        self._local = threading.local()
+        self._shards: List[List] = []
+
+    def _shard(self) -> List:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = [0] * self._size
+            self._local.shard = shard
+            self._shards.append(shard)  # list.append is atomic
+            return shard
+
+    def _merged(self) -> List:
+        merged = [0] * self._size
+        for shard in list(self._shards):
+            for i, value in enumerate(shard):
+                merged[i] += value
+        return merged
+
+
+class Counter(_Sharded):
+    """Monotonic counter (name should end in _total)"""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labels: Labels = ()):
+        super().__init__(1)
+        self.name = name
+        self.help = help
+        self.labels = labels
+
+    def inc(self, amount: float = 1):
+        self._shard()[0] += amount
+
+    @property
+    def value(self) -> float:
+        return self._merged()[0]
+
+    def samples(self) -> List[str]:
+        return [f"{self.name}{_format_labels(self.labels)} {self.value}"]
+
+
+class Gauge:
+    """Point-in-time value (single writer)"""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help: str, labels: Labels = ()):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.value = 0.0
+
+    def set(self, value: float):
+        self.value = value
+
+    def samples(self) -> List[str]:
+        return [f"{self.name}{_format_labels(self.labels)} {self.value}"]
+
+
+class Histogram:
+    """
+    Latency histogram, observed in seconds
+
+    `observe` is a bare list append (atomic under the GIL, so there is no
+    lock or thread-local lookup per call); samples are bucketed in
+    vectorised batches of FLUSH_SIZE, or at scrape time, under a lock.
+    """
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labels: Labels = ()):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.pending: List[float] = []
+        self._lock = threading.Lock()
+        self._buckets = None  # Allocated on first flush (numpy is imported lazily)
+        self._count = 0
+        self._total = 0.0
+
+    def observe(self, seconds: float):
+        pending = self.pending
+        pending.append(seconds)
+        if len(pending) >= FLUSH_SIZE:
+            self.flush()
+
+    def flush(self):
+        """Bucket pending samples; safe against concurrent observers"""
+        import numpy as np
+
+        with self._lock:
+            # Take a prefix instead of swapping lists: samples appended while
+            # flushing land after it and stay pending
+            values = self.pending[:]
+            del self.pending[:len(values)]
+            if not values:
+                return
+            samples = np.asarray(values)
+            if self._buckets is None:
+                self._buckets = np.zeros(NUM_BUCKETS, dtype=np.int64)
+            self._buckets += np.bincount(_bucket_indices(samples), minlength=NUM_BUCKETS)
+            self._count += len(values)
+            self._total += float(samples.sum())
+
+    def _merged(self) -> Tuple[int, float, "np.ndarray"]:
+        import numpy as np
+
+        self.flush()
+        with self._lock:
+            if self._buckets is None:
+                return 0, 0.0, np.zeros(NUM_BUCKETS, dtype=np.int64)
+            return self._count, self._total, self._buckets.copy()
+
+    def snapshot(self) -> Dict:
+        """Count, sum and quantile estimates (seconds)"""
+        import numpy as np
+
+        count, total, buckets = self._merged()
+        quantiles = {}
+        if count:
+            cumulative = np.cumsum(buckets)
+            for q in QUANTILES:
+                index = int(np.searchsorted(cumulative, q * count))
+                quantiles[q] = _bucket_upper(min(index, NUM_BUCKETS - 1)) / 1e6
+        return {"count": count, "sum": total, "quantiles": quantiles}
+
+    def samples(self) -> List[str]:
+        import numpy as np
+
+        count, total, buckets = self._merged()
+        cumulative = np.cumsum(buckets)
+        lines = [
+            f"{self.name}_bucket{_format_labels(self.labels, (('le', le),))} {int(cumulative[index])}"
+            for index, le in _EXPOSED_BUCKETS
+        ]
+        lines.append(f"{self.name}_bucket{_format_labels(self.labels, (('le', '+Inf'),))} {count}")
+        lines.append(f"{self.name}_sum{_format_labels(self.labels)} {total}")
+        lines.append(f"{self.name}_count{_format_labels(self.labels)} {count}")
+        return lines
+
+
+class _NullHistogram:
+    """Stand-in for inline timers when instrumentation is disabled"""
+
+    def observe(self, seconds: float):
+        pass
+
+
+_NULL_HISTOGRAM = _NullHistogram()
+
+
+class Registry:
+    """Named metric families with get-or-create access per label set"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics: Dict[Tuple[str, Labels], object] = {}
+        self._help: Dict[str, Tuple[str, str]] = {}
+
+    def _get(self, cls, name: str, help: str, labels: Optional[Dict[str, str]]):
+        key = (name, tuple(sorted((labels or {}).items())))
+        metric = self._metrics.get(key)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.get(key)
+                if metric is None:
+                    metric = cls(name, help, key[1])
+                    self._metrics[key] = metric
+                    self._help.setdefault(name, (cls.kind, help))
+        return metric
+
+    def counter(self, name: str, help: str = "", labels: Optional[Dict[str, str]] = None) -> Counter:
+        return self._get(Counter, name, help, labels)
+
+    def gauge(self, name: str, help: str = "", labels: Optional[Dict[str, str]] = None) -> Gauge:
+        return self._get(Gauge, name, help, labels)
+
+    def histogram(self, name: str, help: str = "", labels: Optional[Dict[str, str]] = None) -> Histogram:
+        if not ENABLED:
+            return _NULL_HISTOGRAM
+        return self._get(Histogram, name, help, labels)
+
+    def render(self) -> str:
+        """Prometheus text exposition format (0.0.4)"""
+        families: Dict[str, List[object]] = {}
+        for (name, _), metric in list(self._metrics.items()):
+            families.setdefault(name, []).append(metric)
+
+        lines = []
+        for name in sorted(families):
+            kind, help = self._help[name]
+            lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} {kind}")
+            for metric in families[name]:
+                lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+
+def instrumented(name: str, help: str = "", labels: Optional[Dict[str, str]] = None) -> Callable:
+    """
+    Decorator recording call latency of a sync or async function
+
+    Argument forwarding costs ~0.4µs per call, so sub-10µs hot paths time
+    themselves inline with `Histogram.observe` instead. A no-op when
+    instrumentation is disabled.
+    """
+    def decorator(func: Callable) -> Callable:
+        if not ENABLED:
+            return func
+
+        # Histogram.observe inlined: the per-call cost is two clock reads
+        # and a list append
+        histogram = REGISTRY.histogram(name, help, labels)
+        pending = histogram.pending
+        append = pending.append
+        flush = histogram.flush
+        perf_counter = time.perf_counter
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                start = perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    append(perf_counter() - start)
+                    if len(pending) >= FLUSH_SIZE:
+                        flush()
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                append(perf_counter() - start)
+                if len(pending) >= FLUSH_SIZE:
+                    flush()
+        return wrapper
+
+    return decorator
+
+
+def timer_overhead(iterations: int = 100000, rounds: int = 7) -> float:
+    """
+    Per-call cost of timing a code path inline: two clock reads and a
+    histogram observation (fastest of `rounds`, in seconds)
+
+    Divided by a function's own latency this gives the relative overhead
+    of its instrumentation.
+    """
+    histogram = Histogram("sigma_timer_overhead_seconds", "Unregistered probe")
+    observe = histogram.observe
+    perf_counter = time.perf_counter
+
+    best = float("inf")
+    for _ in range(rounds):
+        begin = perf_counter()
+        for _ in range(iterations):
+            start = perf_counter()
+            observe(perf_counter() - start)
+        best = min(best, (perf_counter() - begin) / iterations)
+    return best
+
+
+# Example usage
+if __name__ == "__main__":
+    import timeit
+
+    from metrics.instrumentation import REGISTRY  # The registry the recorder uses, not __main__'s
+    from metrics.lambda_phi_recorder import LambdaPhiRecorder
+
+    recorder = LambdaPhiRecorder()
+    counts = {'0': 487, '1': 537}
+    drifts = [0.02, 0.03, 0.025, 0.028, 0.031]
+
+    cost = timer_overhead()
+    latency = min(timeit.repeat(
+        lambda: recorder.record_metrics(counts, drifts, [0.5, 0.5]), number=2000, repeat=25
+    )) / 2000
+
+    print("Instrumentation Overhead:")
+    print(f"  Inline timer: {cost * 1e9:.0f} ns per observation")
+    print(f"  record_metrics: {latency * 1e6:.2f} µs ({cost / latency:+.2%})")
+    print()
+    print(REGISTRY.render())
@@ -0,0 +1,299 @@
+"""
+Local Statevector Simulator
+===========================
+Minimal OpenQASM 3 stand-in for the qasm/ circuit templates:
+- Parses a circuit once into a compiled gate program
+- Treats named constants as bindable parameters
+- Evaluates a whole batch of parameter bindings in one vectorised pass
+
+Development and benchmarking only. QuantumAgent.v1 forbids simulators
+in production.
+
+ΛΦ = 2.176435×10⁻⁸ s⁻¹
+"""
+
+import re
+import numpy as np
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+from dataclasses import dataclass
+
+
+LAMBDA_PHI = 2.176435e-8
+
+SUPPORTED_GATES = {"h", "x", "cx", "rx", "ry", "rz"}
+PARAMETRIC_GATES = {"rx", "ry", "rz"}
+
+_H = np.array([[1, 1], [1, -1]], dtype=np.complex128) / np.sqrt(2)
+_X = np.array([[0, 1], [1, 0]], dtype=np.complex128)
+
+_BLOCK_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_LINE_COMMENT = re.compile(r"//[^\n]*")
+_QUBIT_DECL = re.compile(r"^qubit\[(\d+)\]\s+(\w+)$")
+_CONST_DECL = re.compile(r"^const\s+\w+\s+(\w+)\s*=\s*(.+)$")
+_GATE_CALL = re.compile(r"^(\w+)(?:\((.*)\))?\s+(.+)$")
+_QUBIT_REF = re.compile(r"^(\w+)\[(\d+)\]$")
+
+
+@dataclass(frozen=True)
+class GateOp:
+    """Single compiled gate: angle = coefficient * bound symbol (or constant)"""
+    name: str
+    qubits: Tuple[int, ...]
+    coefficient: float = 0.0
+    symbol: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class CompiledCircuit:
+    """Parsed circuit ready for repeated parameter binding"""
+    num_qubits: int
+    ops: Tuple[GateOp, ...]
+    parameters: Tuple[str, ...]
+    constants: Dict[str, float]
+
+
+def normalize_qasm(source: str) -> str:
+    """Strip comments and whitespace so equivalent sources compare equal"""
+    source = _BLOCK_COMMENT.sub("", source)
+    source = _LINE_COMMENT.sub("", source)
+    statements = [
+        " ".join(statement.split())
+        for statement in source.split(";")
+    ]
+    return ";\n".join(s for s in statements if s) + ";"
+
+
+def _parse_angle(
+    expr: str,
+    constants: Mapping[str, float],
+    free: Iterable[str]
+) -> Tuple[float, Optional[str]]:
+    """Parse `[-]symbol`, `[-]number` or `number*symbol` angle expressions"""
+    expr = expr.replace(" ", "")
+    sign = 1.0
+    if expr.startswith("-"):
+        sign, expr = -1.0, expr[1:]
+
+    coefficient = 1.0
+    if "*" in expr:
+        factor, expr = expr.split("*", 1)
+        coefficient = float(factor)
+
+    if expr in free:
+        return sign * coefficient, expr
+    if expr in constants:
+        return sign * coefficient * constants[expr], None
+    if expr == "pi":
+        return sign * coefficient * np.pi, None
+    return sign * coefficient * float(expr), None
+
+
+def compile_circuit(
+    source: str,
+    free_parameters: Iterable[str] = ()
+) -> CompiledCircuit:
+    """
+    Compile OpenQASM 3 source into a reusable gate program
+
+    Args:
+        source: OpenQASM 3 text
+        free_parameters: Constant names to leave unbound (sweepable)
+
+    Returns:
+        CompiledCircuit
+    """
+    free = set(free_parameters)
+    registers: Dict[str, int] = {}
+    num_qubits = 0
+    constants: Dict[str, float] = {}
+    ops: List[GateOp] = []
+    parameters: List[str] = []
+
+    for statement in normalize_qasm(source).split(";"):
+        statement = statement.strip()
+        if not statement or statement.startswith(("OPENQASM", "include", "bit")):
+            continue
+        if "measure" in statement:
+            # Measurement is implicit: the simulator returns all outcomes
+            continue
+
+        match = _QUBIT_DECL.match(statement)
+        if match:
+            registers[match.group(2)] = num_qubits
+            num_qubits += int(match.group(1))
+            continue
+
+        match = _CONST_DECL.match(statement)
+        if match:
+            constants[match.group(1)] = float(match.group(2))
+            continue
+
+        match = _GATE_CALL.match(statement)
+        if not match or match.group(1) not in SUPPORTED_GATES:
+            raise ValueError(f"Unsupported QASM statement: {statement}")
+
+        name, angle_expr, targets = match.groups()
+        qubits = []
+        for ref in targets.split(","):
+            ref_match = _QUBIT_REF.match(ref.strip())
+            if not ref_match or ref_match.group(1) not in registers:
+                raise ValueError(f"Unknown qubit reference: {ref.strip()}")
+            qubits.append(registers[ref_match.group(1)] + int(ref_match.group(2)))
+
+        coefficient, symbol = 0.0, None
+        if name in PARAMETRIC_GATES:
+            if angle_expr is None:
+                raise ValueError(f"Gate {name} requires an angle: {statement}")
+            coefficient, symbol = _parse_angle(angle_expr, constants, free)
+            if symbol is not None and symbol not in parameters:
+                parameters.append(symbol)
+
+        ops.append(GateOp(name, tuple(qubits), coefficient, symbol))
+
+    return CompiledCircuit(
+        num_qubits=num_qubits,
+        ops=tuple(ops),
+        parameters=tuple(parameters),
+        constants=constants
+    )
+
+
+class LocalSimulator:
+    """
+    Batched statevector simulator for a single compiled circuit
+
+    Construct once, then call `probabilities` with arrays of parameter
+    values: every binding in the batch is simulated in the same pass.
+    """
+
+    def __init__(self, circuit: CompiledCircuit):
+        self.circuit = circuit
+        self.num_qubits = circuit.num_qubits
+
+    def _apply_single(
+        self,
+        state: np.ndarray,
+        qubit: int,
+        matrix: np.ndarray
+    ) -> np.ndarray:
+        axis = self.num_qubits - qubit  # axis 0 is the batch
+        state = np.moveaxis(state, axis, -1)
+        if matrix.ndim == 2:
+            state = state @ matrix.T
+        else:
+            # Per-binding matrices: (batch, 2, 2)
+            shape = state.shape
+            flat = state.reshape(shape[0], -1, 2)
+            state = np.einsum("bij,bkj->bki", matrix, flat).reshape(shape)
+        return np.moveaxis(state, -1, axis)
+
+    def _apply_cx(self, state: np.ndarray, control: int, target: int) -> np.ndarray:
+        c_axis = self.num_qubits - control
+        t_axis = self.num_qubits - target
+        index = [slice(None)] * state.ndim
+        index[c_axis] = 1
+        controlled = state[tuple(index)]
+        flip_axis = t_axis - 1 if t_axis > c_axis else t_axis
+        state = state.copy()
+        state[tuple(index)] = np.flip(controlled, axis=flip_axis)
+        return state
+
+    @staticmethod
+    def _rotation(name: str, theta: np.ndarray) -> np.ndarray:
+        c = np.cos(theta / 2)
+        s = np.sin(theta / 2)
+        matrix = np.zeros(theta.shape + (2, 2), dtype=np.complex128)
+        if name == "rz":
+            matrix[..., 0, 0] = np.exp(-0.5j * theta)
+            matrix[..., 1, 1] = np.exp(0.5j * theta)
+        elif name == "rx":
+            matrix[..., 0, 0] = c
+            matrix[..., 0, 1] = -1j * s
+            matrix[..., 1, 0] = -1j * s
+            matrix[..., 1, 1] = c
+        else:
+            matrix[..., 0, 0] = c
+            matrix[..., 0, 1] = -s
+            matrix[..., 1, 0] = s
+            matrix[..., 1, 1] = c
+        return matrix
+
+    def probabilities(
+        self,
+        bindings: Optional[Mapping[str, np.ndarray]] = None,
+        batch_size: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Simulate the circuit for a batch of parameter bindings
+
+        Args:
+            bindings: Parameter name -> array of values (one per batch row)
+            batch_size: Batch size when no parameters are bound (default 1)
+
+        Returns:
+            (batch, 2**num_qubits) outcome probabilities, index = bitstring
+        """
+        bindings = {
+            name: np.atleast_1d(np.asarray(values, dtype=np.float64))
+            for name, values in (bindings or {}).items()
+        }
+        missing = set(self.circuit.parameters) - set(bindings)
+        if missing:
+            raise ValueError(f"Unbound parameters: {', '.join(sorted(missing))}")
+
+        batch = batch_size or max((len(v) for v in bindings.values()), default=1)
+        state = np.zeros((batch,) + (2,) * self.num_qubits, dtype=np.complex128)
+        state[(slice(None),) + (0,) * self.num_qubits] = 1.0
+
+        for op in self.circuit.ops:
+            if op.name == "cx":
+                state = self._apply_cx(state, *op.qubits)
+            elif op.name == "h":
+                state = self._apply_single(state, op.qubits[0], _H)
+            elif op.name == "x":
+                state = self._apply_single(state, op.qubits[0], _X)
+            else:
+                if op.symbol is None:
+                    theta = np.full(batch, op.coefficient)
+                else:
+                    theta = op.coefficient * np.broadcast_to(bindings[op.symbol], (batch,))
+                state = self._apply_single(
+                    state, op.qubits[0], self._rotation(op.name, theta)
+                )
+
+        # Flatten qubit axes so the row index is the little-endian bitstring
+        return (np.abs(state) ** 2).reshape(batch, -1)
+
+    def counts(
+        self,
+        shots: int,
+        bindings: Optional[Mapping[str, float]] = None,
+        seed: Optional[int] = None
+    ) -> Dict[str, int]:
+        """Sample measurement counts for a single binding"""
+        probs = self.probabilities(
+            {k: np.array([v]) for k, v in (bindings or {}).items()}
+        )[0]
+        rng = np.random.default_rng(seed)
+        samples = rng.multinomial(shots, probs / probs.sum())
+        return {
+            format(index, f"0{self.num_qubits}b"): int(count)
+            for index, count in enumerate(samples)
+            if count
+        }
+
+
+# Example usage
+if __name__ == "__main__":
+    from pathlib import Path
+
+    qasm_dir = Path(__file__).parent.parent / "qasm"
+    ghz = LocalSimulator(compile_circuit((qasm_dir / "ghz_state.qasm").read_text()))
+    print("GHZ counts:", ghz.counts(shots=1024, seed=7))
+
+    echo = LocalSimulator(compile_circuit(
+        (qasm_dir / "loschmidt_echo.qasm").read_text(),
+        free_parameters=["lambda_phi"]
+    ))
+    probs = echo.probabilities({"lambda_phi": np.array([LAMBDA_PHI, 0.5, 1.0])})
+    print("Echo P(|00⟩):", probs[:, 0])
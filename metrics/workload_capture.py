@@ -0,0 +1,166 @@
+"""
+Σ-Mesh Workload Capture
+=======================
+Opt-in recording of production traffic shapes for deterministic replay:
+- /api/metrics/record ingest payloads
+- SigmaMeshGovernor.route_task calls
+
+Events are timestamped on the hot path and handed to a background writer
+thread through a bounded queue; if the writer falls behind, events are
+dropped (and counted) rather than blocking the caller.
+
+Log format: 8-byte magic, then records of
+    <float64 timestamp><uint8 kind><uint32 length><compact JSON payload>
+
+Enable with SIGMA_CAPTURE_PATH=/path/to/workload.sigcap
+
+ΛΦ = 2.176435×10⁻⁸ s⁻¹
+"""
+
+import atexit
+import json
+import os
+import queue
+import struct
+import threading
+import time
+from typing import Dict, Iterator, Optional, Tuple
+
+
+MAGIC = b"SIGCAP1\n"
+_RECORD = struct.Struct("<dBI")
+
+INGEST = 1
+ROUTE = 2
+KIND_NAMES = {INGEST: "ingest", ROUTE: "route"}
+
+_STOP = object()
+
+
+class WorkloadCapture:
+    """Non-blocking capture log with a background writer thread"""
+
+    def __init__(self, path: str, max_pending: int = 65536, truncate: bool = False):
+        """
+        Args:
+            path: Log file (appended to if it already exists)
+            max_pending: Queue bound before events are dropped (0: unbounded)
+            truncate: Overwrite an existing log instead of appending
+        """
+        self.path = path
+        self.captured = 0
+        self.dropped = 0
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_pending)
+
+        exists = not truncate and os.path.exists(path) and os.path.getsize(path) > 0
+        self._file = open(path, "wb" if truncate else "ab")
+        if not exists:
+            self._file.write(MAGIC)
+
+        self._writer = threading.Thread(
+            target=self._write_loop,
+            name="sigma-workload-capture",
+            daemon=True
+        )
+        self._writer.start()
+
+    def record(self, kind: int, payload: Dict, timestamp: Optional[float] = None):
+        """Enqueue an event (timestamped now unless given); never blocks"""
+        try:
+            self._queue.put_nowait((time.time() if timestamp is None else timestamp, kind, payload))
+            self.captured += 1
+        except queue.Full:
+            self.dropped += 1
+
+    def _write_loop(self):
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+
+            batch = [item]
+            # Drain whatever else is ready so each write call is batched
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    self._write(batch)
+                    self._file.flush()
+                    return
+                batch.append(item)
+
+            self._write(batch)
+            self._file.flush()
+
+    def _write(self, batch):
+        chunks = []
+        for timestamp, kind, payload in batch:
+            body = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+            chunks.append(_RECORD.pack(timestamp, kind, len(body)))
+            chunks.append(body)
+        self._file.write(b"".join(chunks))
+
+    def close(self):
+        """Flush pending events and close the log"""
+        self._queue.put(_STOP)
+        self._writer.join()
+        self._file.close()
+
+    def get_stats(self) -> Dict:
+        return {
+            "path": self.path,
+            "captured": self.captured,
+            "dropped": self.dropped,
+            "pending": self._queue.qsize()
+        }
+
+
+def read_capture(path: str) -> Iterator[Tuple[float, int, Dict]]:
+    """Yield (timestamp, kind, payload) records from a capture log"""
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a Σ-mesh workload capture")
+        while True:
+            header = f.read(_RECORD.size)
+            if len(header) < _RECORD.size:
+                return  # EOF (or a record truncated by a crash)
+            timestamp, kind, length = _RECORD.unpack(header)
+            body = f.read(length)
+            if len(body) < length:
+                return
+            yield timestamp, kind, json.loads(body)
+
+
+_capture: Optional[WorkloadCapture] = None
+_capture_lock = threading.Lock()
+
+
+def get_capture() -> Optional[WorkloadCapture]:
+    """Process-wide capture log, or None unless SIGMA_CAPTURE_PATH is set"""
+    global _capture
+    if _capture is None:
+        path = os.environ.get("SIGMA_CAPTURE_PATH")
+        if not path:
+            return None
+        with _capture_lock:
+            if _capture is None:
+                # One file per process, so multi-worker servers don't interleave
+                if os.environ.get("SIGMA_DASHBOARD_SHM"):
+                    root, ext = os.path.splitext(path)
+                    path = f"{root}.{os.getpid()}{ext}"
+                _capture = WorkloadCapture(path)
+                # The writer is a daemon thread: flush what is still queued
+                # at interpreter exit for owners that never call close_capture()
+                atexit.register(close_capture)
+    return _capture
+
+
+def close_capture():
+    """Flush and close the process-wide capture log, if open"""
+    global _capture
+    with _capture_lock:
+        if _capture is not None:
+            _capture.close()
+            _capture = None
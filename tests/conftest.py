@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Repository root, for the metrics/ and dashboard/ modules
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
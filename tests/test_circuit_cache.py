@@ -0,0 +1,67 @@
+from pathlib import Path
+
+from metrics.circuit_cache import COMPILED, CircuitCache, run_counts_cached
+
+
+GHZ_QASM = (Path(__file__).parent.parent / "qasm" / "ghz_state.qasm").read_text()
+
+
+def test_make_key_ignores_comments_and_whitespace():
+    plain = "OPENQASM 3;\nqubit[2] q;\nh q[0];\ncx q[0], q[1];"
+    noisy = "// Bell pair\nOPENQASM 3;  qubit[2] q;\n\n  h q[0]; /* entangle */ cx  q[0],  q[1] ;"
+
+    assert CircuitCache.make_key(COMPILED, plain, "local") == CircuitCache.make_key(COMPILED, noisy, "local")
+    assert CircuitCache.make_key(COMPILED, plain, "local") != CircuitCache.make_key(COMPILED, plain, "ibm_osaka")
+    assert (
+        CircuitCache.make_key(COMPILED, plain, "local", {"optimization_level": 1})
+        != CircuitCache.make_key(COMPILED, plain, "local", {"optimization_level": 3})
+    )
+
+
+def test_memory_tier_evicts_least_recently_used_by_size():
+    cache = CircuitCache(memory_bytes=2500)
+    cache.put("a", b"a" * 1000)
+    cache.put("b", b"b" * 1000)
+    cache.get("a")
+    cache.put("c", b"c" * 1000)
+
+    assert cache.get("b") == (False, None)
+    assert cache.get("a")[0] and cache.get("c")[0]
+    assert cache.get_stats()["memory_evictions"] == 1
+    assert cache.get_stats()["memory_bytes"] <= 2500
+
+
+def test_disk_tier_evicts_least_recently_used_by_size(tmp_path):
+    cache = CircuitCache(cache_dir=str(tmp_path), memory_bytes=0, disk_bytes=2500)
+    cache.put("aa", b"a" * 1000)
+    cache.put("bb", b"b" * 1000)
+    cache.put("cc", b"c" * 1000)
+
+    assert cache.get("aa") == (False, None)
+    assert cache.get("bb") == (True, b"b" * 1000)
+    assert cache.get_stats()["disk_evictions"] == 1
+    assert sorted(p.stem for p in tmp_path.glob("*/*.pkl")) == ["bb", "cc"]
+
+
+def test_disk_index_reloads_in_new_instance(tmp_path):
+    CircuitCache(cache_dir=str(tmp_path)).put("ab", {"00": 3}, cost=0.5)
+
+    cache = CircuitCache(cache_dir=str(tmp_path))
+
+    assert cache.get("ab") == (True, {"00": 3})
+    stats = cache.get_stats()
+    assert stats["disk_hits"] == 1
+    assert stats["seconds_saved"] == 0.5
+
+
+def test_run_counts_cached_returns_copies():
+    cache = CircuitCache()
+    first = run_counts_cached(GHZ_QASM, shots=256, seed=7, cache=cache)
+    expected = dict(first)
+    first["00"] = -1
+
+    second = run_counts_cached(GHZ_QASM, shots=256, seed=7, cache=cache)
+
+    assert second == expected
+    assert second is not first
+    assert cache.get_stats()["memory_hits"] >= 1
@@ -0,0 +1,49 @@
+from metrics.downsampling import MultiResolutionSeries
+
+
+def build_trimmed_series():
+    """2 h of 1 Hz data, then 5 samples a day later; the 1 s tier trims the 2 h"""
+    series = MultiResolutionSeries(fields=("lambda",), tiers=((1, 100), (60, 100), (3600, 100)))
+    t0 = 1_700_000_000.0
+    for i in range(7200):
+        series.add(t0 + i, {"lambda": float(i)})
+    for i in range(5):
+        series.add(t0 + 86400 + i, {"lambda": 1.0})
+    return series, t0
+
+
+def test_query_skips_tiers_trimmed_past_start():
+    series, t0 = build_trimmed_series()
+
+    points, resolution = series.query(t0, t0 + 86500, max_points=60)
+
+    # 1 s and 1 min tiers both trimmed part of the first 2 h
+    assert resolution == 3600
+    assert points[0]["timestamp"] <= t0 < points[0]["timestamp"] + 3600
+    assert points[-1]["timestamp"] <= t0 + 86400
+
+
+def test_query_uses_minute_tier_where_it_is_complete():
+    series, t0 = build_trimmed_series()
+
+    points, resolution = series.query(t0 + 3600, t0 + 7200, max_points=60)
+
+    assert resolution == 60
+    assert points[0]["timestamp"] <= t0 + 3600 < points[0]["timestamp"] + 60
+
+
+def test_query_uses_finest_tier_inside_retained_range():
+    series, t0 = build_trimmed_series()
+
+    points, resolution = series.query(t0 + 86400, t0 + 86500, max_points=60)
+
+    assert resolution == 1
+    assert [p["timestamp"] for p in points] == [t0 + 86400 + i for i in range(5)]
+
+
+def test_query_without_start_returns_earliest_data():
+    series, t0 = build_trimmed_series()
+
+    points, resolution = series.query(max_points=60)
+
+    assert points[0]["timestamp"] <= t0 < points[0]["timestamp"] + resolution
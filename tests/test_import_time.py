@@ -0,0 +1,39 @@
+"""
+Cold-start import guard: the dashboard and recorder must load without
+pulling in scipy, which is deferred to warm_imports()
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def imported_modules(module: str) -> set:
+    """Modules loaded by a fresh `python -X importtime -c "import <module>"`"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT,
+        env={**os.environ, "PYTHONPATH": str(REPO_ROOT)},
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return {
+        line.rsplit("|", 1)[1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "cumulative" not in line
+    }
+
+
+@pytest.mark.parametrize("module", ["dashboard.server.main", "metrics.lambda_phi_recorder"])
+def test_cold_start_does_not_import_scipy(module):
+    imported = imported_modules(module)
+
+    assert module in imported
+    assert not {name for name in imported if name.split(".")[0] == "scipy"}
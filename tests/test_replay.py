@@ -0,0 +1,19 @@
+import json
+
+from benchmarks.replay import convert_jsonl, load_events
+from metrics.workload_capture import INGEST, ROUTE
+
+
+def test_convert_overwrites_destination(tmp_path):
+    source = tmp_path / "traffic.jsonl"
+    source.write_text("\n".join(json.dumps(r) for r in (
+        {"counts": {"0": 3, "1": 1}, "timestamp": 10.0},
+        {"source": "A", "target": "B"},
+    )))
+    destination = tmp_path / "workload.sigcap"
+
+    convert_jsonl(str(source), str(destination))
+    convert_jsonl(str(source), str(destination))
+
+    events = load_events(str(destination))
+    assert [(timestamp, kind) for timestamp, kind, _ in events] == [(10.0, INGEST), (10.01, ROUTE)]
@@ -0,0 +1,55 @@
+import asyncio
+import os
+import tempfile
+import uuid
+from pathlib import Path
+
+import pytest
+
+from dashboard.server.shared_state import MetricsHub, SharedMetricsRing
+
+
+METRICS = {"Λ": 0.9, "Φ": 0.1, "Γ": 0.01, "W₂": 0.02, "timestamp": 1.0}
+
+
+@pytest.fixture
+def ring():
+    ring = SharedMetricsRing(f"sigma_test_{uuid.uuid4().hex[:8]}", capacity=16, create=True)
+    yield ring
+    ring.close()
+
+
+def test_publish_wakes_peers_that_join_later(ring):
+    async def scenario():
+        received = []
+
+        async def deliver(records):
+            received.extend(records)
+
+        publisher = MetricsHub(ring, deliver)
+        publisher.start()
+        publisher.publish(METRICS)
+
+        late = MetricsHub(ring, deliver)
+        late.start()
+        publisher.publish(METRICS)
+        await asyncio.sleep(0.05)
+
+        publisher.close()
+        late.close()
+        return received
+
+    # Publisher drains both records; the late hub replays the first as
+    # history and is woken for the second
+    assert len(asyncio.run(scenario())) == 3
+
+
+def test_hub_refuses_directory_open_to_other_users(ring):
+    hub_dir = Path(tempfile.gettempdir()) / f"{ring.name}.hub"
+    hub_dir.mkdir(mode=0o755)
+    os.chmod(hub_dir, 0o755)
+    try:
+        with pytest.raises(PermissionError):
+            MetricsHub(ring, None)
+    finally:
+        hub_dir.rmdir()
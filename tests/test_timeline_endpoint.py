@@ -0,0 +1,39 @@
+import asyncio
+import time
+
+import pytest
+
+from dashboard.server import main
+from metrics.downsampling import MultiResolutionSeries
+
+
+def get_timeline(**params):
+    params = {"max_points": 60, "start": None, "end": None, "series": "phi", **params}
+    return asyncio.run(main.lambda_phi_timeline(**params))
+
+
+@pytest.fixture
+def timeline(monkeypatch):
+    series = MultiResolutionSeries(fields=tuple(main.TIMELINE_FIELDS.values()))
+    monkeypatch.setattr(main, "timeline", series)
+    monkeypatch.setattr(main, "metrics_store", [])
+    return series
+
+
+def test_simulated_hour_only_before_any_ingest(timeline):
+    response = get_timeline()
+
+    assert len(response["timeline"]) == 60
+    assert response["resolution_seconds"] == 60
+
+
+def test_empty_range_after_ingest_returns_no_points(timeline):
+    now = time.time()
+    for i in range(3):
+        main.store_metrics({"Λ": 0.9, "Φ": 0.8, "Γ": 0.01, "W₂": 0.02, "timestamp": now + i})
+
+    response = get_timeline(start=now + 86400)
+
+    assert response["timeline"] == []
+    assert response["resolution_seconds"] is None
+    assert len(get_timeline(start=now)["timeline"]) == 3